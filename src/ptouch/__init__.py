@@ -24,52 +24,56 @@ Example usage:
     >>> printer.print(label)
 """
 
-from .connection import (
-    Connection,
-    ConnectionNetwork,
-    ConnectionUSB,
-    PrinterConnectionError,
-    PrinterNetworkError,
-    PrinterNotFoundError,
-    PrinterPermissionError,
-    PrinterTimeoutError,
-    PrinterWriteError,
-    parse_usb_uri,
-)
-from .label import Align, Label, TextLabel
-from .printer import LabelPrinter, MediaType, TapeConfig
-from .printers import PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW
-from .tape import (
-    # Heat shrink tubes (HSe series)
-    HeatShrinkTube,
-    HeatShrinkTube3_1_5_2mm,
-    HeatShrinkTube3_1_9_0mm,
-    HeatShrinkTube3_1_11_2mm,
-    HeatShrinkTube3_1_21_0mm,
-    HeatShrinkTube3_1_31_0mm,
-    HeatShrinkTube5_8mm,
-    HeatShrinkTube8_8mm,
-    HeatShrinkTube11_7mm,
-    HeatShrinkTube17_7mm,
-    HeatShrinkTube23_6mm,
-    # Deprecated aliases (use Tape*mm instead)
-    LaminatedTape,
-    LaminatedTape3_5mm,
-    LaminatedTape6mm,
-    LaminatedTape9mm,
-    LaminatedTape12mm,
-    LaminatedTape18mm,
-    LaminatedTape24mm,
-    LaminatedTape36mm,
-    Tape,
-    Tape3_5mm,
-    Tape6mm,
-    Tape9mm,
-    Tape12mm,
-    Tape18mm,
-    Tape24mm,
-    Tape36mm,
-)
+# Importing typing costs more than the rest of the CLI start-up. The flag is
+# private so it does not become part of the package namespace; type checkers
+# still follow the imports below.
+_TYPE_CHECKING = False
+
+if _TYPE_CHECKING:
+    from .connection import (
+        Connection,
+        ConnectionNetwork,
+        ConnectionUSB,
+        PrinterConnectionError,
+        PrinterNetworkError,
+        PrinterNotFoundError,
+        PrinterPermissionError,
+        PrinterTimeoutError,
+        PrinterWriteError,
+        parse_usb_uri,
+    )
+    from .label import Align, Label, TextLabel
+    from .printer import LabelPrinter, MediaType, TapeConfig
+    from .printers import PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW
+    from .tape import (
+        HeatShrinkTube,
+        HeatShrinkTube3_1_5_2mm,
+        HeatShrinkTube3_1_9_0mm,
+        HeatShrinkTube3_1_11_2mm,
+        HeatShrinkTube3_1_21_0mm,
+        HeatShrinkTube3_1_31_0mm,
+        HeatShrinkTube5_8mm,
+        HeatShrinkTube8_8mm,
+        HeatShrinkTube11_7mm,
+        HeatShrinkTube17_7mm,
+        HeatShrinkTube23_6mm,
+        LaminatedTape,
+        LaminatedTape3_5mm,
+        LaminatedTape6mm,
+        LaminatedTape9mm,
+        LaminatedTape12mm,
+        LaminatedTape18mm,
+        LaminatedTape24mm,
+        LaminatedTape36mm,
+        Tape,
+        Tape3_5mm,
+        Tape6mm,
+        Tape9mm,
+        Tape12mm,
+        Tape18mm,
+        Tape24mm,
+        Tape36mm,
+    )
 
 __version__ = "1.1.0"
 
@@ -134,3 +138,79 @@ __all__ = [
     "Label",
     "TextLabel",
 ]
+
+# Public names are resolved lazily (PEP 562) so that ``import ptouch`` does not
+# pull in Pillow, pyusb and every printer/tape class up front.
+_LAZY: dict[str, str] = (
+    {
+        name: ".connection"
+        for name in (
+            "Connection",
+            "ConnectionNetwork",
+            "ConnectionUSB",
+            "PrinterConnectionError",
+            "PrinterNetworkError",
+            "PrinterNotFoundError",
+            "PrinterPermissionError",
+            "PrinterTimeoutError",
+            "PrinterWriteError",
+            "parse_usb_uri",
+        )
+    }
+    | {name: ".label" for name in ("Align", "Label", "TextLabel")}
+    | {name: ".printer" for name in ("LabelPrinter", "MediaType", "TapeConfig")}
+    | {
+        name: ".printers"
+        for name in ("PTE550W", "PTP750W", "PTP900", "PTP900W", "PTP910BT", "PTP950NW")
+    }
+    | {
+        name: ".tape"
+        for name in (
+            "Tape",
+            "Tape3_5mm",
+            "Tape6mm",
+            "Tape9mm",
+            "Tape12mm",
+            "Tape18mm",
+            "Tape24mm",
+            "Tape36mm",
+            "HeatShrinkTube",
+            "HeatShrinkTube5_8mm",
+            "HeatShrinkTube8_8mm",
+            "HeatShrinkTube11_7mm",
+            "HeatShrinkTube17_7mm",
+            "HeatShrinkTube23_6mm",
+            "HeatShrinkTube3_1_5_2mm",
+            "HeatShrinkTube3_1_9_0mm",
+            "HeatShrinkTube3_1_11_2mm",
+            "HeatShrinkTube3_1_21_0mm",
+            "HeatShrinkTube3_1_31_0mm",
+            "LaminatedTape",
+            "LaminatedTape3_5mm",
+            "LaminatedTape6mm",
+            "LaminatedTape9mm",
+            "LaminatedTape12mm",
+            "LaminatedTape18mm",
+            "LaminatedTape24mm",
+            "LaminatedTape36mm",
+        )
+    }
+)
+
+
+def __getattr__(name: str) -> object:
+    """Import public names from their submodule on first access."""
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the public names, including those not imported yet."""
+    return sorted(__all__)
@@ -4,16 +4,15 @@
 
 """CLI interface for Brother P-touch label printers."""
 
-import argparse
-import sys
-from typing import Sequence
+from __future__ import annotations
 
-from PIL import Image, ImageFont
+import os
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from types import SimpleNamespace
 
-from . import (
-    Align,
-    ConnectionNetwork,
-    ConnectionUSB,
+from .tape import (
     HeatShrinkTube3_1_5_2mm,
     HeatShrinkTube3_1_9_0mm,
     HeatShrinkTube3_1_11_2mm,
@@ -24,13 +23,6 @@ from . import (
     HeatShrinkTube11_7mm,
     HeatShrinkTube17_7mm,
     HeatShrinkTube23_6mm,
-    Label,
-    PTE550W,
-    PTP750W,
-    PTP900,
-    PTP900W,
-    PTP910BT,
-    PTP950NW,
     Tape3_5mm,
     Tape6mm,
     Tape9mm,
@@ -38,10 +30,22 @@ from . import (
     Tape18mm,
     Tape24mm,
     Tape36mm,
-    TextLabel,
-    parse_usb_uri,
 )
-from .printer import LabelPrinter
+
+# See ptouch/__init__.py: avoid importing typing on the CLI start-up path
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import argparse
+
+    from PIL import ImageFont
+
+    from .label import Align, TextLabel
+    from .tape import Tape
+
+# Minimum number of labels before rendering is spread over a process pool.
+# Below this, starting the worker processes costs more than it saves.
+PARALLEL_RENDER_THRESHOLD = 4
 
 # Mapping of tape width (mm) to tape classes
 TAPE_WIDTHS = {
@@ -71,32 +75,132 @@ TUBE_WIDTHS = {
     31.0: HeatShrinkTube3_1_31_0mm,
 }
 
-# Mapping of printer names to printer classes
+# Mapping of printer names to printer class names in ptouch.printers.
+# Classes are resolved after argument parsing so that --help and argument
+# errors do not import the printer, connection and raster modules.
 PRINTER_TYPES = {
-    "E550W": PTE550W,
-    "P750W": PTP750W,
-    "P900": PTP900,
-    "P900W": PTP900W,
-    "P910BT": PTP910BT,
-    "P950NW": PTP950NW,
+    "E550W": "PTE550W",
+    "P750W": "PTP750W",
+    "P900": "PTP900",
+    "P900W": "PTP900W",
+    "P910BT": "PTP910BT",
+    "P950NW": "PTP950NW",
 }
 
-# Mapping of alignment strings to Align flags
+# Argument choices, in definition order for stable --help output
+_PRINTER_CHOICES = tuple(PRINTER_TYPES)
+_TAPE_CHOICES = tuple(TAPE_WIDTHS)
+_TUBE_CHOICES = tuple(TUBE_WIDTHS)
+
+# Mapping of alignment strings to Align flag names. The flags are looked up
+# once Pillow (and with it ptouch.label) has been imported.
 ALIGN_HORIZONTAL = {
-    "left": Align.LEFT,
-    "center": Align.HCENTER,
-    "right": Align.RIGHT,
+    "left": "LEFT",
+    "center": "HCENTER",
+    "right": "RIGHT",
 }
 
 ALIGN_VERTICAL = {
-    "top": Align.TOP,
-    "center": Align.VCENTER,
-    "bottom": Align.BOTTOM,
+    "top": "TOP",
+    "center": "VCENTER",
+    "bottom": "BOTTOM",
+}
+
+# All valid (horizontal, vertical) argument pairs, precomputed so the CLI
+# validates --align with a single lookup.
+_ALIGN_COMBOS = {
+    (h, v): (h_name, v_name)
+    for h, h_name in ALIGN_HORIZONTAL.items()
+    for v, v_name in ALIGN_VERTICAL.items()
 }
+_VALID_ALIGNS = ", ".join(f"{h} {v}" for h, v in _ALIGN_COMBOS)
+
+
+# Options understood by the argument fast path, mapped to their destination.
+# Anything else falls back to argparse.
+_FAST_PATH_FLAGS = {
+    "--printer": "printer",
+    "-p": "printer",
+    "--tape-width": "tape_width",
+    "-t": "tape_width",
+    "--host": "host",
+    "-H": "host",
+}
+
+
+def _parse_args_fast(argv: Sequence[str]) -> SimpleNamespace | None:
+    """Parse the common ``TEXT... --printer P --tape-width W --host H`` form.
+
+    Only handles plain text arguments combined with the printer, tape width
+    and host options, validated the same way as :func:`parse_args`. This
+    skips importing argparse and building the full parser for the typical
+    batch-printing invocation.
+
+    Parameters
+    ----------
+    argv : Sequence[str]
+        Command line arguments without the program name.
+
+    Returns
+    -------
+    SimpleNamespace or None
+        Parsed arguments with the same attributes and defaults as
+        :func:`parse_args`, or None if the arguments need the full parser.
+    """
+    values: dict[str, str] = {}
+    text: list[str] = []
+    text_open = False
+    tokens = iter(argv)
+    for token in tokens:
+        if not token.startswith("-"):
+            # argparse only accepts the text as one contiguous run
+            if text and not text_open:
+                return None
+            text.append(token)
+            text_open = True
+            continue
+        text_open = False
+        dest = _FAST_PATH_FLAGS.get(token)
+        value = next(tokens, None)
+        if dest is None or value is None or value.startswith("-"):
+            return None
+        values[dest] = value
+
+    if not text or values.keys() != {"printer", "tape_width", "host"}:
+        return None
+    if values["printer"] not in _PRINTER_CHOICES:
+        return None
+    try:
+        tape_width = float(values["tape_width"])
+    except ValueError:
+        return None
+    if tape_width not in _TAPE_CHOICES:
+        return None
+
+    return SimpleNamespace(
+        text=text,
+        image=None,
+        host=values["host"],
+        usb=None,
+        printer=values["printer"],
+        tape_width=tape_width,
+        tube_width=None,
+        font=None,
+        font_size=None,
+        align=["center", "center"],
+        high_resolution=False,
+        margin=None,
+        no_compression=False,
+        full_cut=False,
+        copies=1,
+        width=None,
+    )
 
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="ptouch",
         description="Print labels on Brother P-touch printers.",
@@ -176,7 +280,7 @@ Examples:
         "--printer",
         "-p",
         required=True,
-        choices=list(set(PRINTER_TYPES.keys())),
+        choices=_PRINTER_CHOICES,
         help="Printer model",
     )
 
@@ -186,14 +290,14 @@ Examples:
         "--tape-width",
         "-t",
         type=float,
-        choices=list(TAPE_WIDTHS.keys()),
+        choices=_TAPE_CHOICES,
         help="Laminated tape width in mm",
     )
     media_group.add_argument(
         "--tube-width",
         "-T",
         type=float,
-        choices=list(TUBE_WIDTHS.keys()),
+        choices=_TUBE_CHOICES,
         help="Heat shrink tube diameter in mm (2:1: 5.8/8.8/11.7/17.7/23.6, "
         "3:1: 5.2/9.0/11.2/21.0/31.0)",
     )
@@ -266,7 +370,7 @@ Examples:
 
 def create_text_labels(
     texts: Sequence[str],
-    tape_class: type,
+    tape_class: type[Tape],
     font: str | ImageFont.FreeTypeFont,
     align: Align,
     font_size: int | None = None,
@@ -279,7 +383,7 @@ def create_text_labels(
     ----------
     texts : Sequence[str]
         List of text strings to create labels for.
-    tape_class : type
+    tape_class : type[Tape]
         Tape class to use for all labels.
     font : str or ImageFont.FreeTypeFont
         Path to TrueType font file or ImageFont object.
@@ -297,6 +401,8 @@ def create_text_labels(
     list[TextLabel]
         List of TextLabel instances.
     """
+    from .label import TextLabel
+
     return [
         TextLabel(
             text,
@@ -311,9 +417,81 @@ def create_text_labels(
     ]
 
 
+@lru_cache(maxsize=1)
+def _default_font() -> ImageFont.FreeTypeFont:
+    """Load Pillow's default font once per process.
+
+    Returns
+    -------
+    PIL.ImageFont.FreeTypeFont
+        The scalable default font.
+
+    Raises
+    ------
+    RuntimeError
+        If the installed Pillow only provides the bitmap default font.
+    """
+    from PIL import ImageFont
+
+    default_font = ImageFont.load_default()
+    if not isinstance(default_font, ImageFont.FreeTypeFont):
+        raise RuntimeError(
+            "PIL default font is not scalable. Please upgrade Pillow to 10.1+ or provide --font"
+        )
+    return default_font
+
+
+def _render_text_label(label: TextLabel, height: int, resolution_dpi: int) -> TextLabel:
+    """Render a single text label (process pool worker)."""
+    label.prepare(height, resolution_dpi)
+    return label
+
+
+def render_text_labels(
+    labels: Sequence[TextLabel], height: int, resolution_dpi: int
+) -> list[TextLabel]:
+    """Render text labels ahead of printing.
+
+    Font layout and rasterization are CPU-bound, so larger batches are
+    rendered in a process pool. Labels using a pre-loaded font object are
+    rendered serially since ImageFont objects cannot be pickled.
+
+    Parameters
+    ----------
+    labels : Sequence[TextLabel]
+        Labels to render.
+    height : int
+        Print height in pixels (tape_config.print_pins).
+    resolution_dpi : int
+        Printer resolution in DPI.
+
+    Returns
+    -------
+    list[TextLabel]
+        The rendered labels, in the same order.
+    """
+    if len(labels) < PARALLEL_RENDER_THRESHOLD or not all(
+        isinstance(label.font, str) for label in labels
+    ):
+        return [_render_text_label(label, height, resolution_dpi) for label in labels]
+
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
+    render = partial(_render_text_label, height=height, resolution_dpi=resolution_dpi)
+    chunksize = max(1, len(labels) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(render, labels, chunksize=chunksize))
+
+
 def main() -> int:
     """Run the command-line interface."""
-    args = parse_args()
+    args: argparse.Namespace | SimpleNamespace | None = None
+    # PTOUCH_NO_FASTPATH=1 forces the full argparse parser, e.g. for debugging
+    if not os.environ.get("PTOUCH_NO_FASTPATH"):
+        args = _parse_args_fast(sys.argv[1:])
+    if args is None:
+        args = parse_args()
 
     # Validate arguments
     if args.image and args.text:
@@ -328,8 +506,12 @@ def main() -> int:
         print("Error: --copies must be at least 1", file=sys.stderr)
         return 1
 
+    from . import printers
+    from .connection import ConnectionNetwork, ConnectionUSB, parse_usb_uri
+    from .printer import LabelPrinter
+
     # Get printer and media classes
-    printer_class = PRINTER_TYPES[args.printer]
+    printer_class: type[LabelPrinter] = getattr(printers, PRINTER_TYPES[args.printer])
 
     # Determine media class (tape or tube)
     if args.tape_width is not None:
@@ -368,119 +550,134 @@ def main() -> int:
             print(f"Error: {e}", file=sys.stderr)
             return 1
 
-    # Create printer
-    use_compression = not args.no_compression
-    printer = printer_class(
-        connection,
-        use_compression=use_compression,
-        high_resolution=args.high_resolution,
-    )
-
-    # Create label(s)
-    if args.image:
-        image = Image.open(args.image)
-        labels = [Label(image, media_class)]
-    else:
-        # Parse alignment
-        h_align = ALIGN_HORIZONTAL.get(args.align[0].lower())
-        v_align = ALIGN_VERTICAL.get(args.align[1].lower())
+    # Closing the connection on exit releases the USB interface or socket
+    with connection:
+        # Create printer
+        use_compression = not args.no_compression
+        printer = printer_class(
+            connection,
+            use_compression=use_compression,
+            high_resolution=args.high_resolution,
+        )
 
-        if h_align is None:
-            print(
-                f"Error: Invalid horizontal alignment '{args.align[0]}'. Use: left, center, right",
-                file=sys.stderr,
-            )
-            return 1
-        if v_align is None:
-            print(
-                f"Error: Invalid vertical alignment '{args.align[1]}'. Use: top, center, bottom",
-                file=sys.stderr,
-            )
+        try:
+            tape_config = printer.get_tape_config(media_class())
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
             return 1
 
-        align = h_align | v_align
+        # Create label(s)
+        if args.image:
+            from PIL import Image
+
+            from .label import Label
 
-        # Determine font: use provided path or try default font
-        font: str | ImageFont.FreeTypeFont
-        if args.font:
-            font = args.font
+            image = Image.open(args.image)
+            # The printer only uses luminance, so let JPEG sources decode straight
+            # to grayscale. The size is kept: images taller than the print area
+            # are still cropped by the printer, not scaled.
+            image.draft("L", image.size)
+            labels = [Label(image, media_class)]
         else:
-            try:
-                default_font = ImageFont.load_default()
-                # Check if it's a scalable font (has font_variant method)
-                if not hasattr(default_font, "font_variant") or not isinstance(
-                    default_font, ImageFont.FreeTypeFont
-                ):
+            # Parse alignment
+            args.align = [a.lower() for a in args.align]
+            align_names = _ALIGN_COMBOS.get((args.align[0], args.align[1]))
+            if align_names is None:
+                print(
+                    f"Error: Invalid alignment '{' '.join(args.align)}'. "
+                    f"Use one of: {_VALID_ALIGNS}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            from .label import Align
+
+            h_align, v_align = align_names
+            align = Align.__members__[h_align] | Align.__members__[v_align]
+
+            # Determine font: use provided path or try default font
+            font: str | ImageFont.FreeTypeFont
+            if args.font:
+                font = args.font
+            else:
+                try:
+                    font = _default_font()
+                except RuntimeError as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    return 1
+                except Exception as e:
+                    print(f"Error: Could not load default font: {e}", file=sys.stderr)
+                    print("Please provide --font with a path to a TrueType font", file=sys.stderr)
+                    return 1
+
+            # Calculate image width: --width is total label length, subtract margins (both sides)
+            margin_mm = args.margin if args.margin is not None else LabelPrinter.DEFAULT_MARGIN_MM
+            min_width_mm = None
+            if args.width is not None:
+                min_width_mm = args.width - (2 * margin_mm)
+                if min_width_mm <= 0:
                     print(
-                        "Error: PIL default font is not scalable. "
-                        "Please upgrade Pillow to 10.1+ or provide --font",
+                        f"Error: --width must be greater than 2x margin ({2 * margin_mm}mm)",
                         file=sys.stderr,
                     )
                     return 1
-                font = default_font
-            except Exception as e:
-                print(f"Error: Could not load default font: {e}", file=sys.stderr)
-                print("Please provide --font with a path to a TrueType font", file=sys.stderr)
-                return 1
 
-        # Calculate image width: --width is total label length, subtract margins (both sides)
-        margin_mm = args.margin if args.margin is not None else LabelPrinter.DEFAULT_MARGIN_MM
-        min_width_mm = None
-        if args.width is not None:
-            min_width_mm = args.width - (2 * margin_mm)
-            if min_width_mm <= 0:
-                print(
-                    f"Error: --width must be greater than 2x margin ({2 * margin_mm}mm)",
-                    file=sys.stderr,
+            # auto_size=True (default) unless font_size is explicitly set
+            auto_size = args.font_size is None
+
+            text_labels = create_text_labels(
+                args.text,
+                media_class,
+                font=font,
+                align=align,
+                font_size=args.font_size,
+                min_width_mm=min_width_mm,
+                auto_size=auto_size,
+            )
+
+            try:
+                labels = list(
+                    render_text_labels(text_labels, tape_config.print_pins, printer.RESOLUTION_DPI)
                 )
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
                 return 1
 
-        # auto_size=True (default) unless font_size is explicitly set
-        auto_size = args.font_size is None
-
-        labels = create_text_labels(
-            args.text,
-            media_class,
-            font=font,
-            align=align,
-            font_size=args.font_size,
-            min_width_mm=min_width_mm,
-            auto_size=auto_size,
+        # Apply copies
+        if args.copies > 1:
+            labels = labels * args.copies
+
+        # Print
+        num_labels = len(labels)
+        use_half_cut = not args.full_cut
+        conn_type = "network" if args.host else "USB"
+        print(f"Printing {num_labels} label(s) to {printer_class.__name__} via {conn_type}...")
+        media_label = "Tube" if media_type == "tube" else "Tape"
+        print(
+            f"{media_label}: {media_width}mm, High-res: {args.high_resolution}, "
+            f"Compression: {use_compression}"
         )
+        if num_labels > 1:
+            cut_type = "half-cut" if use_half_cut else "full-cut"
+            print(f"Using {cut_type} between labels, full cut after last label.")
 
-    # Apply copies
-    if args.copies > 1:
-        labels = labels * args.copies
-
-    # Print
-    num_labels = len(labels)
-    use_half_cut = not args.full_cut
-    conn_type = "network" if args.host else "USB"
-    print(f"Printing {num_labels} label(s) to {printer_class.__name__} via {conn_type}...")
-    media_label = "Tube" if media_type == "tube" else "Tape"
-    print(
-        f"{media_label}: {media_width}mm, High-res: {args.high_resolution}, "
-        f"Compression: {use_compression}"
-    )
-    if num_labels > 1:
-        cut_type = "half-cut" if use_half_cut else "full-cut"
-        print(f"Using {cut_type} between labels, full cut after last label.")
-
-    try:
-        if num_labels == 1:
-            printer.print(labels[0], margin_mm=args.margin, high_resolution=args.high_resolution)
-        else:
-            printer.print_multi(
-                labels,
-                margin_mm=args.margin,
-                high_resolution=args.high_resolution,
-                half_cut=use_half_cut,
-            )
-        print("Done.")
-        return 0
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
+        try:
+            if num_labels == 1:
+                printer.print(
+                    labels[0], margin_mm=args.margin, high_resolution=args.high_resolution
+                )
+            else:
+                printer.print_multi(
+                    labels,
+                    margin_mm=args.margin,
+                    high_resolution=args.high_resolution,
+                    half_cut=use_half_cut,
+                )
+            print("Done.")
+            return 0
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
 
 
 if __name__ == "__main__":
@@ -6,20 +6,107 @@
 
 from __future__ import annotations
 
+import contextlib
 import errno
+import random
+import re
 import socket
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from array import array
+from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
-import usb.core
-import usb.util
-
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from typing import Self
+
     from .printer import LabelPrinter
 
 # USB vendor ID for Brother Industries
 USB_VENDOR_ID = 0x04F9
 
+# Platforms whose USB backends have no detachable kernel driver
+_NO_KERNEL_DRIVER_PLATFORMS = ("win32", "cygwin", "darwin")
+
+# USB write errors that retrying cannot fix: access denied or device gone
+_USB_FATAL_ERRNOS = frozenset({errno.EACCES, errno.ENODEV, errno.ENOENT})
+
+# Devices handed back by ConnectionUSB.close(), keyed by (vendor_id, product_id, serial),
+# so reconnecting shortly afterwards skips the USB bus enumeration. connect() takes
+# the entry out, so a device is never shared between open connections.
+USB_DEVICE_CACHE_TTL = 2.0  # seconds
+_USB_DEVICE_CACHE: dict[tuple[int, int, str | None], tuple[float, Any]] = {}
+
+# Idle sockets handed back with ConnectionNetwork.release(), keyed by (host, port),
+# so the next connection to the same printer skips the TCP handshake
+NETWORK_POOL_SIZE = 4  # idle sockets kept per printer
+_NET_POOL: defaultdict[tuple[str, int], list[socket.socket]] = defaultdict(list)
+_NET_POOL_LOCK = threading.Lock()
+
+# Retry backoff for transient write failures: exponential, capped, with jitter
+RETRY_BASE_DELAY = 0.05  # seconds before the first retry
+RETRY_MAX_DELAY = 2.0  # upper bound for a single delay (before jitter)
+RETRY_JITTER = 0.5  # up to +50% random extra delay
+
+# usb://[vendor:]product[/serial] with hex IDs; the serial must be hex characters only
+_USB_URI_RE = re.compile(
+    r"""
+    usb://
+    (?:(?P<vendor>0x[0-9a-fA-F]+)?:)?
+    (?P<product>0x[0-9a-fA-F]+)
+    (?:/(?P<serial>[0-9a-fA-F]+))?
+    """,
+    re.VERBOSE,
+)
+
+
+def _retry_delay(attempt: int) -> float:
+    """Return the backoff delay in seconds before retrying after ``attempt``.
+
+    Parameters
+    ----------
+    attempt : int
+        Zero-based index of the attempt that just failed.
+
+    Returns
+    -------
+    float
+        Delay in seconds.
+    """
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (1 << attempt))
+    return delay * (1 + random.random() * RETRY_JITTER)
+
+
+def _socket_is_idle(sock: socket.socket) -> bool:
+    """Check that a pooled socket is still connected and has no unread data.
+
+    Parameters
+    ----------
+    sock : socket.socket
+        Socket taken from the pool.
+
+    Returns
+    -------
+    bool
+        True if the socket can be reused for a new print job.
+    """
+    try:
+        if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+            return False
+        sock.setblocking(False)
+        try:
+            # Pending data is a stale reply and b"" means the printer hung up
+            sock.recv(1, socket.MSG_PEEK)
+        except BlockingIOError:
+            return True
+        return False
+    except OSError:
+        return False
+
 
 def parse_usb_uri(uri: str) -> tuple[int | None, int | None, str | None]:
     """Parse a USB device URI into vendor_id, product_id, and serial.
@@ -53,28 +140,17 @@ def parse_usb_uri(uri: str) -> tuple[int | None, int | None, str | None]:
     >>> parse_usb_uri("usb://:0x2086/A1B2C3D4E5")
     (None, 0x2086, 'A1B2C3D4E5')
     """
-    import re
-
-    # Pattern: usb://[vendor]:[product][/serial]
-    # Serial must be hex characters only
-    pattern = r"^usb://(?:(?P<vendor>0x[0-9a-fA-F]+)?:)?(?P<product>0x[0-9a-fA-F]+)(?:/(?P<serial>[0-9a-fA-F]+))?$"
-    match = re.match(pattern, uri)
-
-    if not match:
+    match = _USB_URI_RE.fullmatch(uri)
+    if match is None:
         raise ValueError(
             f"Invalid USB URI format: '{uri}'. "
             "Expected format: usb://[vendor:]product[/serial] "
             "(e.g., usb://0x04f9:0x2086/A1B2C3D4E5 or usb://:0x2086)"
         )
 
-    vendor_str = match.group("vendor")
-    product_str = match.group("product")
-    serial = match.group("serial")
-
+    vendor_str, product_str, serial = match.group("vendor", "product", "serial")
     vendor_id = int(vendor_str, 16) if vendor_str else None
-    product_id = int(product_str, 16) if product_str else None
-
-    return vendor_id, product_id, serial
+    return vendor_id, int(product_str, 16), serial
 
 
 class PrinterConnectionError(Exception):
@@ -86,11 +162,24 @@ class PrinterConnectionError(Exception):
         Human-readable error message.
     original_error : Exception, optional
         The underlying exception that caused this error.
+    host : str, optional
+        Host of the network printer involved, if any.
+    port : int, optional
+        TCP port of the network printer involved, if any.
     """
 
-    def __init__(self, message: str, original_error: Exception | None = None) -> None:
+    def __init__(
+        self,
+        message: str,
+        original_error: Exception | None = None,
+        *,
+        host: str | None = None,
+        port: int | None = None,
+    ) -> None:
         super().__init__(message)
         self.original_error = original_error
+        self.host = host
+        self.port = port
 
 
 class PrinterNotFoundError(PrinterConnectionError):
@@ -142,9 +231,74 @@ class PrinterWriteError(PrinterConnectionError):
     """
 
 
+# Network connect failures, most specific first; the OSError entry catches the rest
+_CONNECT_ERRORS: tuple[tuple[type[OSError], type[PrinterConnectionError], str], ...] = (
+    (
+        socket.timeout,
+        PrinterTimeoutError,
+        "Connection to printer at {host}:{port} timed out after {timeout}s",
+    ),
+    (
+        ConnectionRefusedError,
+        PrinterNetworkError,
+        "Connection refused by printer at {host}:{port}. "
+        "Check if the printer is powered on and accepts network connections.",
+    ),
+    (
+        socket.gaierror,
+        PrinterNetworkError,
+        "Cannot resolve hostname '{host}'. Check if the hostname or IP address is correct.",
+    ),
+    (OSError, PrinterNetworkError, "Failed to connect to printer at {host}:{port}: {error}"),
+)
+
+# Network write failures; timeouts are only reported once the retries are used up
+_WRITE_ERRORS: tuple[tuple[type[OSError], type[PrinterConnectionError], str], ...] = (
+    (
+        socket.timeout,
+        PrinterTimeoutError,
+        "Write to printer at {host}:{port} timed out after {retries} attempts",
+    ),
+    (BrokenPipeError, PrinterNetworkError, "Connection to printer at {host}:{port} was lost"),
+    (ConnectionResetError, PrinterNetworkError, "Connection to printer at {host}:{port} was lost"),
+    (OSError, PrinterWriteError, "Failed to write to printer at {host}:{port}: {error}"),
+)
+
+# Network read failures
+_READ_ERRORS: tuple[tuple[type[OSError], type[PrinterConnectionError], str], ...] = (
+    (socket.timeout, PrinterTimeoutError, "Read from printer at {host}:{port} timed out"),
+    (BrokenPipeError, PrinterNetworkError, "Connection to printer at {host}:{port} was lost"),
+    (ConnectionResetError, PrinterNetworkError, "Connection to printer at {host}:{port} was lost"),
+    (OSError, PrinterNetworkError, "Failed to read from printer at {host}:{port}: {error}"),
+)
+
+
+def _match_endpoint_in(endpoint: Any) -> bool:
+    """Return True if the USB endpoint is an IN (device-to-host) endpoint."""
+    import usb.util
+
+    return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_IN
+
+
+def _match_endpoint_out(endpoint: Any) -> bool:
+    """Return True if the USB endpoint is an OUT (host-to-device) endpoint."""
+    import usb.util
+
+    return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_OUT
+
+
 class Connection(ABC):
     """Abstract base class for printer connections."""
 
+    # Buffered data is written automatically once this many bytes are pending
+    WRITE_BUFFER_SIZE = 64 * 1024
+
+    _write_buffer: list[bytes] | None = None
+    _write_buffer_size = 0
+    _writer: ThreadPoolExecutor | None = None
+    _pending_writes: list[Future[None]] | None = None
+    _writer_failed = False
+
     @abstractmethod
     def connect(self, printer: LabelPrinter) -> None:
         """Establish the connection to the printer.
@@ -169,6 +323,115 @@ class Connection(ABC):
     def close(self) -> None:
         """Close the connection and release resources."""
 
+    def writev(self, chunks: Sequence[bytes]) -> None:
+        """Write several chunks of data to the printer as one transfer.
+
+        The default implementation joins the chunks and calls write().
+        Subclasses can override this to send the chunks without joining them.
+
+        Parameters
+        ----------
+        chunks : Sequence[bytes]
+            Chunks to send to the printer, in order.
+        """
+        self.write(b"".join(chunks))
+
+    def begin_burst(self) -> None:
+        """Mark the start of a burst of writes that belong together.
+
+        Connections can use this to hold back partial packets until
+        end_burst() is called. The default implementation does nothing.
+        """
+        return None
+
+    def end_burst(self) -> None:
+        """Mark the end of a burst started with begin_burst().
+
+        The default implementation does nothing.
+        """
+        return None
+
+    def write_buffered(self, payload: bytes) -> None:
+        """Queue data to be written to the printer.
+
+        Once WRITE_BUFFER_SIZE bytes are pending, the queued data is handed to
+        a background writer thread and sent with a single writev() call while
+        the caller prepares the next chunk. Call flush() to send the rest and
+        wait for all queued data to be written.
+
+        Parameters
+        ----------
+        payload : bytes
+            Bytes to send to the printer.
+        """
+        if self._write_buffer is None:
+            self._write_buffer = []
+        self._write_buffer.append(payload)
+        self._write_buffer_size += len(payload)
+        if self._write_buffer_size >= self.WRITE_BUFFER_SIZE:
+            chunks = self._take_write_buffer()
+            if self._writer is None or self._pending_writes is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                # A single worker keeps the writes in order
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ptouch-write")
+                self._pending_writes = []
+            self._pending_writes.append(self._writer.submit(self._write_in_background, chunks))
+
+    def flush(self) -> None:
+        """Write all data queued by write_buffered() to the printer.
+
+        Waits until data handed to the background writer has been sent and
+        raises the first error it encountered.
+        """
+        chunks = self._take_write_buffer()
+        writer, pending = self._writer, self._pending_writes
+        if writer is None or pending is None:
+            if chunks:
+                self.writev(chunks)
+            return
+
+        self._writer = self._pending_writes = None
+        if chunks:
+            pending.append(writer.submit(self._write_in_background, chunks))
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            # Chunks queued after a failed one are skipped by the writer
+            writer.shutdown()
+            self._writer_failed = False
+
+    def discard(self) -> None:
+        """Drop data queued by write_buffered() that has not been sent yet.
+
+        Chunks still waiting for the background writer are cancelled, and a
+        write already in progress is waited for, but its errors are ignored.
+        """
+        self._take_write_buffer()
+        writer = self._writer
+        self._writer = self._pending_writes = None
+        if writer is not None:
+            writer.shutdown(cancel_futures=True)
+            self._writer_failed = False
+
+    def _take_write_buffer(self) -> list[bytes]:
+        """Remove and return the chunks queued by write_buffered()."""
+        chunks = self._write_buffer or []
+        self._write_buffer = []
+        self._write_buffer_size = 0
+        return chunks
+
+    def _write_in_background(self, chunks: list[bytes]) -> None:
+        """Send chunks from the writer thread unless an earlier write failed."""
+        if self._writer_failed:
+            return
+        try:
+            self.writev(chunks)
+        except BaseException:
+            self._writer_failed = True
+            raise
+
     def read(self, num_bytes: int = 1024) -> bytes:
         """Read data from the printer (optional, not all connections support this).
 
@@ -189,8 +452,12 @@ class Connection(ABC):
         """
         raise NotImplementedError("This connection does not support reading")
 
-    def __del__(self) -> None:
-        """Clean up connection on garbage collection."""
+    def __enter__(self) -> Self:
+        """Return the connection for use in a ``with`` block."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the connection when leaving a ``with`` block."""
         self.close()
 
 
@@ -240,6 +507,7 @@ class ConnectionUSB(Connection):
         self._product_id = product_id
         self._serial = serial
         self._device: Any = None
+        self._cache_key: tuple[int, int, str | None] | None = None
         self._ep_in: Any = None
         self._ep_out: Any = None
         self._kernel_driver_detached = False
@@ -272,17 +540,20 @@ class ConnectionUSB(Connection):
                     "USB connection requires a printer class with USB_PRODUCT_ID attribute."
                 )
 
-        vendor_id = self._vendor_id if self._vendor_id is not None else USB_VENDOR_ID
-
-        # Build find kwargs
-        find_kwargs: dict[str, Any] = {
-            "idVendor": vendor_id,
-            "idProduct": product_id,
-        }
-        if self._serial is not None:
-            find_kwargs["serial_number"] = self._serial
+        # pyusb is an optional dependency and not needed for network printing
+        try:
+            import usb.core
+            import usb.util
+        except ImportError as e:
+            raise PrinterConnectionError(
+                "USB support requires pyusb. Install it with: pip install ptouch[usb]",
+                original_error=e,
+            ) from e
 
-        self._device = usb.core.find(**find_kwargs)
+        vendor_id = self._vendor_id if self._vendor_id is not None else USB_VENDOR_ID
+        cache_key = (vendor_id, product_id, self._serial)
+        self._cache_key = cache_key
+        self._device = self._find_device(cache_key)
         if self._device is None:
             if self._serial:
                 raise PrinterNotFoundError(
@@ -297,12 +568,14 @@ class ConnectionUSB(Connection):
 
         try:
             interface = self._device[0].interfaces()[0]
-            if self._device.is_kernel_driver_active(interface.bInterfaceNumber):
+            if self._kernel_driver_active(interface.bInterfaceNumber):
                 self._device.detach_kernel_driver(interface.bInterfaceNumber)
                 self._kernel_driver_detached = True
 
             self._device.set_configuration()
         except usb.core.USBError as e:
+            # A device that failed to initialize must not be cached by close()
+            self._cache_key = None
             if e.errno == errno.EACCES:
                 raise PrinterPermissionError(
                     "Permission denied accessing USB printer. "
@@ -318,14 +591,8 @@ class ConnectionUSB(Connection):
         intf = usb.util.find_descriptor(cfg, bInterfaceClass=7)
         assert intf is not None
 
-        def match_endpoint_in(endpoint: Any) -> bool:
-            return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_IN
-
-        def match_endpoint_out(endpoint: Any) -> bool:
-            return usb.util.endpoint_direction(endpoint.bEndpointAddress) == usb.util.ENDPOINT_OUT
-
-        self._ep_in = usb.util.find_descriptor(intf, custom_match=match_endpoint_in)
-        self._ep_out = usb.util.find_descriptor(intf, custom_match=match_endpoint_out)
+        self._ep_in = usb.util.find_descriptor(intf, custom_match=_match_endpoint_in)
+        self._ep_out = usb.util.find_descriptor(intf, custom_match=_match_endpoint_out)
 
         if self._ep_in is None or self._ep_out is None:
             raise PrinterNotFoundError(
@@ -346,23 +613,60 @@ class ConnectionUSB(Connection):
         PrinterWriteError
             If not all bytes were written successfully after retries.
         """
-        import time
+        # PyUSB copies anything that is not an array('B') on every write call,
+        # so convert once up front instead of once per attempt
+        self._write_array(array("B", payload), retries)
+
+    def writev(self, chunks: Sequence[bytes], retries: int = 3) -> None:
+        """Write several chunks of data to the printer as one USB transfer.
+
+        The chunks are copied straight into the array('B') handed to PyUSB,
+        skipping the intermediate joined bytes object.
+
+        Parameters
+        ----------
+        chunks : Sequence[bytes]
+            Chunks to send to the printer, in order.
+        retries : int, default 3
+            Number of retry attempts for transient failures.
+
+        Raises
+        ------
+        PrinterWriteError
+            If not all bytes were written successfully after retries.
+        """
+        data = array("B")
+        for chunk in chunks:
+            data.frombytes(chunk)
+        self._write_array(data, retries)
+
+    def _write_array(self, data: array[int], retries: int) -> None:
+        """Write a prepared array('B') to the OUT endpoint, retrying on errors."""
+        import usb.core
+
+        size = len(data)
 
         last_error = None
         for attempt in range(retries):
             try:
-                written = self._ep_out.write(payload, timeout=5000)
-                if written != len(payload):
+                written = self._ep_out.write(data, timeout=5000)
+                if written != size:
                     raise PrinterWriteError(
-                        f"USB write incomplete: {written}/{len(payload)} bytes written. "
+                        f"USB write incomplete: {written}/{size} bytes written. "
                         "This may indicate a USB communication issue. "
                         "Try reconnecting the printer or using a different USB port."
                     )
                 return  # Success
             except usb.core.USBError as e:
                 last_error = e
+                if e.errno in _USB_FATAL_ERRNOS:
+                    raise PrinterWriteError(
+                        f"USB write failed: {e}. "
+                        "The printer was disconnected or access to it was denied.",
+                        original_error=e,
+                    ) from e
                 if attempt < retries - 1:
-                    time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                    time.sleep(_retry_delay(attempt))
                     continue
                 raise PrinterWriteError(
                     f"USB write failed after {retries} attempts: {e}. "
@@ -379,15 +683,70 @@ class ConnectionUSB(Connection):
                 original_error=last_error,
             )
 
+    @staticmethod
+    def _find_device(cache_key: tuple[int, int, str | None]) -> Any:
+        """Find a USB device, reusing one recently closed with the same IDs and serial.
+
+        Parameters
+        ----------
+        cache_key : tuple[int, int, str | None]
+            Vendor ID, product ID and serial number (or None) to match.
+
+        Returns
+        -------
+        usb.core.Device or None
+            The device, or None if no matching device is connected.
+        """
+        import usb.core
+
+        cached = _USB_DEVICE_CACHE.pop(cache_key, None)
+        if cached is not None and time.monotonic() - cached[0] < USB_DEVICE_CACHE_TTL:
+            return cached[1]
+
+        vendor_id, product_id, serial = cache_key
+        find_kwargs: dict[str, Any] = {"idVendor": vendor_id, "idProduct": product_id}
+        if serial is not None:
+            find_kwargs["serial_number"] = serial
+        return usb.core.find(**find_kwargs)
+
+    def _kernel_driver_active(self, interface_number: int) -> bool:
+        """Check whether a kernel driver is bound to the given interface.
+
+        Windows and macOS backends have no kernel driver that libusb can
+        detach, so the probe is skipped there.
+
+        Parameters
+        ----------
+        interface_number : int
+            USB interface number to check.
+
+        Returns
+        -------
+        bool
+            True if a kernel driver needs to be detached before claiming.
+        """
+        if sys.platform in _NO_KERNEL_DRIVER_PLATFORMS:
+            return False
+        try:
+            return bool(self._device.is_kernel_driver_active(interface_number))
+        except NotImplementedError:
+            return False  # Backend cannot query or detach kernel drivers
+
     def close(self) -> None:
         """Close USB connection and reattach kernel driver if needed."""
         if self._device is not None:
+            import usb.core
+            import usb.util
+
             usb.util.dispose_resources(self._device)
             if self._kernel_driver_detached:
                 try:
                     self._device.attach_kernel_driver(0)
                 except usb.core.USBError:
                     pass  # Ignore errors when reattaching kernel driver
+            if self._cache_key is not None:
+                # pyusb reopens a disposed device on its next use
+                _USB_DEVICE_CACHE[self._cache_key] = (time.monotonic(), self._device)
             self._device = None
 
 
@@ -406,6 +765,12 @@ class ConnectionNetwork(Connection):
         Connection timeout in seconds. Also used for read/write operations.
     """
 
+    # Socket send buffer size, large enough to queue a long label without blocking
+    SEND_BUFFER_SIZE = 256 * 1024
+
+    # Maximum number of buffers passed to a single sendmsg() call (IOV_MAX on Linux)
+    MAX_IOV = 1024
+
     def __init__(self, host: str, port: int = 9100, timeout: float = 5.0) -> None:
         self._socket: socket.socket | None = None
         self.host = host
@@ -429,47 +794,89 @@ class ConnectionNetwork(Connection):
         """
         del printer  # unused for network connections
 
+        self._socket = self._take_pooled_socket()
+        if self._socket is not None:
+            self._socket.settimeout(self.timeout)
+            return
+
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         # Disable Nagle's algorithm to send packets immediately
         self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SEND_BUFFER_SIZE)
         self._socket.settimeout(self.timeout)
 
         try:
             self._socket.connect((self.host, self.port))
-        except socket.timeout as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterTimeoutError(
-                f"Connection to printer at {self.host}:{self.port} timed out after {self.timeout}s",
-                original_error=e,
-            ) from e
-        except ConnectionRefusedError as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterNetworkError(
-                f"Connection refused by printer at {self.host}:{self.port}. "
-                "Check if the printer is powered on and accepts network connections.",
-                original_error=e,
-            ) from e
-        except socket.gaierror as e:
-            self._socket.close()
-            self._socket = None
-            raise PrinterNetworkError(
-                f"Cannot resolve hostname '{self.host}'. "
-                "Check if the hostname or IP address is correct.",
-                original_error=e,
-            ) from e
         except OSError as e:
             self._socket.close()
             self._socket = None
-            raise PrinterNetworkError(
-                f"Failed to connect to printer at {self.host}:{self.port}: {e}",
-                original_error=e,
-            ) from e
+            raise self._wrap_error(_CONNECT_ERRORS, e) from e
+
+    def _wrap_error(
+        self,
+        errors: tuple[tuple[type[OSError], type[PrinterConnectionError], str], ...],
+        error: OSError,
+        retries: int = 1,
+    ) -> PrinterConnectionError:
+        """Wrap a socket error in the printer error of the first matching table entry.
+
+        Parameters
+        ----------
+        errors : tuple
+            ``(error type, wrapper, message template)`` entries, most specific
+            first and ending with a catch-all ``OSError`` entry.
+        error : OSError
+            The socket error to wrap.
+        retries : int, default 1
+            Number of attempts made, for the message template.
+
+        Returns
+        -------
+        PrinterConnectionError
+            The wrapped error, carrying this printer's host and port.
+        """
+        for error_type, wrapper, message in errors:
+            if isinstance(error, error_type):
+                return wrapper(
+                    message.format(
+                        host=self.host,
+                        port=self.port,
+                        timeout=self.timeout,
+                        retries=retries,
+                        error=error,
+                    ),
+                    original_error=error,
+                    host=self.host,
+                    port=self.port,
+                )
+        raise error  # unreachable with a catch-all OSError entry
+
+    def _take_pooled_socket(self) -> socket.socket | None:
+        """Take an idle socket to this printer from the pool, if one is still usable.
+
+        Returns
+        -------
+        socket.socket or None
+            A connected socket, or None if the pool has no usable socket.
+        """
+        while True:
+            with _NET_POOL_LOCK:
+                idle = _NET_POOL.get((self.host, self.port))
+                if not idle:
+                    return None
+                sock = idle.pop()
+            if _socket_is_idle(sock):
+                return sock
+            sock.close()
 
     def write(self, payload: bytes, retries: int = 3) -> None:
         """Write data to the printer via network with retry logic.
 
+        Sends with send() until the payload is out, so the timeout applies to
+        each stalled send rather than the whole payload, and a retry after a
+        timeout resumes at the first unsent byte instead of resending data the
+        printer already received.
+
         Parameters
         ----------
         retries : int, default 3
@@ -486,43 +893,91 @@ class ConnectionNetwork(Connection):
         PrinterWriteError
             If write operation fails.
         """
-        import time
-
         if self._socket is None:
-            raise PrinterConnectionError("Not connected to printer")
+            raise PrinterConnectionError("Not connected to printer", host=self.host, port=self.port)
 
-        last_error = None
-        for attempt in range(retries):
+        view = memoryview(payload)
+        attempt = 0
+        while view:
             try:
-                self._socket.sendall(payload)
-                return  # Success
+                sent = self._socket.send(view)
             except socket.timeout as e:
-                last_error = e
                 if attempt < retries - 1:
-                    time.sleep(0.1 * (attempt + 1))  # Exponential backoff
+                    time.sleep(_retry_delay(attempt))
+                    attempt += 1
                     continue
-                raise PrinterTimeoutError(
-                    f"Write to printer at {self.host}:{self.port} timed out "
-                    f"after {retries} attempts",
-                    original_error=e,
-                ) from e
-            except (BrokenPipeError, ConnectionResetError) as e:
-                raise PrinterNetworkError(
-                    f"Connection to printer at {self.host}:{self.port} was lost",
-                    original_error=e,
-                ) from e
+                raise self._wrap_error(_WRITE_ERRORS, e, retries) from e
             except OSError as e:
-                raise PrinterWriteError(
-                    f"Failed to write to printer at {self.host}:{self.port}: {e}",
-                    original_error=e,
-                ) from e
+                raise self._wrap_error(_WRITE_ERRORS, e, retries) from e
+            view = view[sent:]
 
-        if last_error:
-            raise PrinterTimeoutError(
-                f"Write to printer at {self.host}:{self.port} failed after {retries} attempts. "
-                "Check network connection and ensure the printer is powered on and accessible.",
-                original_error=last_error,
-            )
+    def begin_burst(self) -> None:
+        """Cork the socket so a burst of writes is sent in full-sized segments.
+
+        Uses TCP_CORK where available (Linux); does nothing otherwise.
+        """
+        if self._socket is not None and hasattr(socket, "TCP_CORK"):
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+
+    def end_burst(self) -> None:
+        """Uncork the socket, sending any data held back since begin_burst()."""
+        if self._socket is not None and hasattr(socket, "TCP_CORK"):
+            # A failure here means the connection is gone; the next write reports it
+            with contextlib.suppress(OSError):
+                self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+    def writev(self, chunks: Sequence[bytes], retries: int = 3) -> None:
+        """Write several chunks of data to the printer with a gathering send.
+
+        Uses sendmsg() so the chunks are not joined in Python first. Partial
+        sends resume where they stopped, including after a timeout. Falls back
+        to write() on platforms without sendmsg().
+
+        Parameters
+        ----------
+        chunks : Sequence[bytes]
+            Chunks to send to the printer, in order.
+        retries : int, default 3
+            Number of retry attempts for transient failures (timeout only).
+
+        Raises
+        ------
+        PrinterConnectionError
+            If not connected to printer.
+        PrinterTimeoutError
+            If write operation times out after retries.
+        PrinterNetworkError
+            If connection is lost during write.
+        PrinterWriteError
+            If write operation fails.
+        """
+        if self._socket is None:
+            raise PrinterConnectionError("Not connected to printer", host=self.host, port=self.port)
+        if not hasattr(self._socket, "sendmsg"):
+            self.write(b"".join(chunks), retries=retries)
+            return
+
+        pending = [memoryview(chunk) for chunk in chunks if chunk]
+        start = 0
+        attempt = 0
+        while start < len(pending):
+            try:
+                sent = self._socket.sendmsg(pending[start : start + self.MAX_IOV])
+            except socket.timeout as e:
+                if attempt < retries - 1:
+                    time.sleep(_retry_delay(attempt))
+                    attempt += 1
+                    continue
+                raise self._wrap_error(_WRITE_ERRORS, e, retries) from e
+            except OSError as e:
+                raise self._wrap_error(_WRITE_ERRORS, e, retries) from e
+
+            # Skip fully sent chunks and trim a partially sent one
+            while sent and sent >= len(pending[start]):
+                sent -= len(pending[start])
+                start += 1
+            if sent:
+                pending[start] = pending[start][sent:]
 
     def read(self, num_bytes: int = 1024) -> bytes:
         """Read data from the printer via network.
@@ -537,25 +992,29 @@ class ConnectionNetwork(Connection):
             If connection is lost or read fails.
         """
         if self._socket is None:
-            raise PrinterConnectionError("Not connected to printer")
+            raise PrinterConnectionError("Not connected to printer", host=self.host, port=self.port)
 
         try:
             return self._socket.recv(num_bytes)
-        except socket.timeout as e:
-            raise PrinterTimeoutError(
-                f"Read from printer at {self.host}:{self.port} timed out",
-                original_error=e,
-            ) from e
-        except (BrokenPipeError, ConnectionResetError) as e:
-            raise PrinterNetworkError(
-                f"Connection to printer at {self.host}:{self.port} was lost",
-                original_error=e,
-            ) from e
         except OSError as e:
-            raise PrinterNetworkError(
-                f"Failed to read from printer at {self.host}:{self.port}: {e}",
-                original_error=e,
-            ) from e
+            raise self._wrap_error(_READ_ERRORS, e) from e
+
+    def release(self) -> None:
+        """Hand the socket back to the pool for reuse by the next connection.
+
+        A later connect() to the same host and port, on this or another
+        ConnectionNetwork, reuses the socket instead of opening a new one.
+        The socket is closed instead if the pool for this printer is full.
+        """
+        if self._socket is None:
+            return
+        sock, self._socket = self._socket, None
+        with _NET_POOL_LOCK:
+            idle = _NET_POOL[(self.host, self.port)]
+            if len(idle) < NETWORK_POOL_SIZE:
+                idle.append(sock)
+                return
+        sock.close()
 
     def close(self) -> None:
         """Close the network connection."""
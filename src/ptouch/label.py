@@ -5,12 +5,19 @@
 """Label classes for Brother P-touch label printers."""
 
 from enum import Flag, auto
+from functools import lru_cache
 
 from PIL import Image, ImageDraw, ImageFont
 
 from .tape import Tape
 
 
+@lru_cache(maxsize=32)
+def _load_truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, reusing the face for labels sharing font and size."""
+    return ImageFont.truetype(path, size)
+
+
 class Label:
     """A label to be printed on a specific tape.
 
@@ -144,7 +151,7 @@ class TextLabel(Label):
             # Auto-size font to 80% of print height
             font_size = int(height * 0.8)
             if isinstance(self.font, str):
-                font = ImageFont.truetype(self.font, font_size)
+                font = _load_truetype(self.font, font_size)
             else:
                 # ImageFont object - use font_variant() to create scaled version
                 if hasattr(self.font, "font_variant"):
@@ -156,7 +163,7 @@ class TextLabel(Label):
             # Use explicit font_size or ImageFont's built-in size
             if isinstance(self.font, str):
                 font_size = self.font_size if self.font_size is not None else int(height * 0.8)
-                font = ImageFont.truetype(self.font, font_size)
+                font = _load_truetype(self.font, font_size)
             else:
                 font = self.font
 
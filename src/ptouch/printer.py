@@ -7,6 +7,8 @@
 import logging
 import struct
 from abc import ABC
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from math import ceil
@@ -27,7 +29,7 @@ from .tape import (
 )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TapeConfig:
     """Pin configuration for a specific printer/tape combination.
 
@@ -45,6 +47,11 @@ class TapeConfig:
     print_pins: int
     right_pins: int
 
+    @property
+    def is_full_width(self) -> bool:
+        """Whether the printable area spans the whole print head (no margin pins)."""
+        return self.left_pins == 0 and self.right_pins == 0
+
 
 class MediaType(Enum):
     """Media type identifiers for Brother P-touch printers."""
@@ -59,6 +66,9 @@ class MediaType(Enum):
 
 logger = logging.getLogger(__name__)
 
+# Translation table that inverts every bit of a byte
+_INVERT_BITS = bytes(0xFF - i for i in range(256))
+
 
 class LabelPrinter(ABC):
     """Abstract base class for Brother P-touch label printers.
@@ -77,8 +87,8 @@ class LabelPrinter(ABC):
         High (horizontal) resolution in DPI when enabled.
     DEFAULT_USE_COMPRESSION : bool
         Whether to use TIFF compression by default.
-    PIN_CONFIGS : dict[type[Tape], TapeConfig]
-        Dict mapping tape type to TapeConfig.
+    PIN_CONFIGS : Mapping[type[Tape], TapeConfig]
+        Read-only mapping of tape type to TapeConfig.
     """
 
     # Subclasses must define these
@@ -87,7 +97,7 @@ class LabelPrinter(ABC):
     RESOLUTION_DPI: int
     RESOLUTION_DPI_HIGH: int = 0  # 0 means no high resolution support
     DEFAULT_USE_COMPRESSION: bool
-    PIN_CONFIGS: dict[type[Tape], TapeConfig]
+    PIN_CONFIGS: Mapping[type[Tape], TapeConfig]
 
     # Capability flags - what the printer supports
     SUPPORTS_AUTO_CUT: bool = True
@@ -207,7 +217,8 @@ class LabelPrinter(ABC):
             If the tape type is not supported by this printer.
         """
         tape_type = type(tape)
-        if tape_type not in self.PIN_CONFIGS:
+        config = self.PIN_CONFIGS.get(tape_type)
+        if config is None:
             supported = ", ".join(
                 t.__name__ for t in sorted(self.PIN_CONFIGS.keys(), key=lambda t: t.width_mm)
             )
@@ -215,7 +226,7 @@ class LabelPrinter(ABC):
                 f"{tape_type.__name__} is not supported by {self.__class__.__name__}. "
                 f"Supported tapes: {supported}"
             )
-        return self.PIN_CONFIGS[tape_type]
+        return config
 
     def _cmd_invalidate(self, length: int = 200) -> bytes:
         """Send invalidate command (null bytes) to clear printer buffer."""
@@ -423,40 +434,20 @@ class LabelPrinter(ABC):
         """
         config = tape_config
 
-        # Use pixel access object for faster pixel reading
-        pixels = img_1bit.load()
-        assert pixels is not None, "Failed to load image pixels"
-
-        # Pre-allocate column bits array (reused for each column)
-        column_bits = [0] * self.TOTAL_PINS
-
-        # Build raster column by column
-        raster = bytearray(img_1bit.width * self.BYTES_PER_LINE)
-        raster_idx = 0
-
-        for column in range(img_1bit.width):
-            # Left margin pins are already 0 from initialization
-            # Read print area pixels
-            for row in range(config.print_pins):
-                # In 1-bit images: 0 = black (print), 255 = white (no print)
-                column_bits[config.left_pins + row] = 1 if pixels[column, row] == 0 else 0
-
-            # Right margin pins are already 0 from initialization
-
-            # Pack bits into bytes
-            for i in range(0, self.TOTAL_PINS, 8):
-                byte = 0
-                for j in range(8):
-                    if column_bits[i + j]:
-                        byte |= 1 << (7 - j)
-                raster[raster_idx] = byte
-                raster_idx += 1
-
-            # Reset print area for next column (margins stay 0)
-            for row in range(config.print_pins):
-                column_bits[config.left_pins + row] = 0
-
-        return bytes(raster)
+        if not (config.is_full_width and config.print_pins == self.TOTAL_PINS):
+            # Place the printable area between the margin pins on a canvas as
+            # tall as the print head; the margins stay white (not printed).
+            if img_1bit.height != config.print_pins:
+                img_1bit = img_1bit.crop((0, 0, img_1bit.width, config.print_pins))
+            canvas = Image.new("1", (img_1bit.width, self.TOTAL_PINS), 1)
+            canvas.paste(img_1bit, (0, config.left_pins))
+            img_1bit = canvas
+
+        # Transposing turns every image column into a packed row of TOTAL_PINS
+        # bits, one raster line each. Pillow stores white as 1 while the
+        # printer expects 1 for a printed (black) dot, so invert the bits.
+        transposed = img_1bit.transpose(Image.Transpose.TRANSPOSE)
+        return transposed.tobytes().translate(_INVERT_BITS)
 
     def _additional_control_commands(self) -> bytes:
         """Return printer-specific control commands.
@@ -551,28 +542,41 @@ class LabelPrinter(ABC):
             Formatted raster data for the printer.
         """
         repeat_count = 2 if high_resolution else 1
+        empty_line = bytes(self.BYTES_PER_LINE)
 
-        raster_data = b""
+        # Labels typically repeat many identical raster lines (blank columns,
+        # uniform strokes), so each distinct line is encoded only once per job.
+        encoded_lines: dict[bytes, bytes] = {}
+
+        raster_data = bytearray()
         for i in range(num_lines):
             line_data = raster[i * self.BYTES_PER_LINE : (i + 1) * self.BYTES_PER_LINE]
 
-            for _ in range(repeat_count):
+            encoded = encoded_lines.get(line_data)
+            if encoded is None:
                 if self.use_compression:
                     # TIFF/packbits compression
-                    if line_data == b"\x00" * self.BYTES_PER_LINE:
-                        raster_data += b"\x5a"  # Z - Zero raster graphics
+                    if line_data == empty_line:
+                        encoded = b"\x5a"  # Z - Zero raster graphics
                     else:
                         compressed_line = packbits.encode(line_data)
-                        raster_data += b"\x47"  # G - Raster graphics transfer
-                        raster_data += struct.pack("<H", len(compressed_line))
-                        raster_data += compressed_line
+                        encoded = (
+                            b"\x47"  # G - Raster graphics transfer
+                            + struct.pack("<H", len(compressed_line))
+                            + compressed_line
+                        )
                 else:
                     # No compression - send all lines including empty ones
-                    raster_data += b"\x47"  # G - Raster graphics transfer
-                    raster_data += struct.pack("<H", self.BYTES_PER_LINE)
-                    raster_data += line_data
+                    encoded = (
+                        b"\x47"  # G - Raster graphics transfer
+                        + struct.pack("<H", self.BYTES_PER_LINE)
+                        + line_data
+                    )
+                encoded_lines[line_data] = encoded
+
+            raster_data += encoded * repeat_count
 
-        return raster_data
+        return bytes(raster_data)
 
     def print(
         self,
@@ -611,14 +615,80 @@ class LabelPrinter(ABC):
         """
         # Resolve high_resolution setting
         high_res = self.high_resolution if high_resolution is None else high_resolution
+        with self._send_job():
+            self._print_encoded(
+                label,
+                self._encode_label(label, high_res),
+                margin_mm=margin_mm,
+                high_resolution=high_res,
+                feed=feed,
+                auto_cut=auto_cut,
+                half_cut=half_cut,
+            )
+
+    @contextmanager
+    def _send_job(self) -> Iterator[None]:
+        """Send the data queued within the block to the printer as one burst.
+
+        If the block raises, data that has not been sent yet is discarded
+        rather than flushed, so the printer does not receive a partial job.
+        """
+        self.connection.begin_burst()
+        try:
+            yield
+        except BaseException:
+            self.connection.discard()
+            raise
+        else:
+            self.connection.flush()
+        finally:
+            self.connection.end_burst()
+
+    def _encode_label(self, label: Label, high_resolution: bool) -> tuple[int, bytes]:
+        """Render a label and encode it into raster data.
+
+        Parameters
+        ----------
+        label : Label
+            Label to encode.
+        high_resolution : bool
+            Whether to use high resolution mode.
+
+        Returns
+        -------
+        tuple[int, bytes]
+            Number of raster lines and the formatted raster data.
 
+        Raises
+        ------
+        ValueError
+            If the label's tape type is not supported by this printer.
+        """
         tape_config = self.get_tape_config(label.tape)
         label.prepare(tape_config.print_pins, self.RESOLUTION_DPI)
-        image = label.image
 
-        img_1bit = self._prepare_image(image, tape_config)
+        img_1bit = self._prepare_image(label.image, tape_config)
         raster = self._generate_raster(img_1bit, tape_config)
-        num_lines = image.width
+        num_lines = label.image.width
+
+        return num_lines, self._build_raster_data(raster, num_lines, high_resolution)
+
+    def _print_encoded(
+        self,
+        label: Label,
+        encoded: tuple[int, bytes],
+        margin_mm: float | None,
+        high_resolution: bool,
+        feed: bool,
+        auto_cut: bool | None,
+        half_cut: bool | None,
+    ) -> None:
+        """Queue an already encoded label on the connection.
+
+        The caller flushes the connection once the job is complete. See print()
+        for a description of the parameters.
+        """
+        num_lines, raster_data = encoded
 
         # Resolve margin and validate bounds
         margin_mm = margin_mm if margin_mm is not None else self.DEFAULT_MARGIN_MM
@@ -629,15 +699,15 @@ class LabelPrinter(ABC):
             )
         margin_dots = self._mm_to_dots(margin_mm)
 
-        logger.info(f"Image: {image.size}")
+        logger.info(f"Image: {label.image.size}")
         logger.info(
-            f"{self.__class__.__name__}: {len(raster)} bytes, {num_lines} columns, "
-            f"{self.BYTES_PER_LINE} bytes/column"
+            f"{self.__class__.__name__}: {num_lines * self.BYTES_PER_LINE} bytes, "
+            f"{num_lines} columns, {self.BYTES_PER_LINE} bytes/column"
         )
         logger.info(f"Tape: {label.tape.width_mm}mm")
         logger.info(f"Margin: {margin_mm}mm ({margin_dots} dots)")
         logger.info(f"Compression: {'ON (TIFF)' if self.use_compression else 'OFF'}")
-        if high_res:
+        if high_resolution:
             logger.info(f"Resolution: High ({self.RESOLUTION_DPI}x{self.RESOLUTION_DPI_HIGH} dpi)")
         else:
             logger.info(f"Resolution: Standard ({self.RESOLUTION_DPI}x{self.RESOLUTION_DPI} dpi)")
@@ -646,22 +716,21 @@ class LabelPrinter(ABC):
             num_lines=num_lines,
             margin=margin_dots,
             tape=label.tape,
-            high_resolution=high_res,
+            high_resolution=high_resolution,
             is_first_page=False,
             auto_cut=auto_cut if auto_cut is not None else self.DEFAULT_AUTO_CUT,
             half_cut=half_cut if half_cut is not None else self.DEFAULT_HALF_CUT,
             chain_printing=False,
         )
 
-        raster_data = self._build_raster_data(raster, num_lines, high_res)
-
         # Choose print command: 0x0C (print) or 0x1A (print and feed)
         print_cmd = b"\x1a" if feed else b"\x0c"
 
-        all_data = control_seq + raster_data + print_cmd
-        self.connection.write(all_data)
+        self.connection.write_buffered(control_seq)
+        self.connection.write_buffered(raster_data)
+        self.connection.write_buffered(print_cmd)
 
-        logger.info("Sent all data to printer.")
+        logger.info("Queued all data for printer.")
 
     def print_multi(
         self,
@@ -672,8 +741,9 @@ class LabelPrinter(ABC):
     ) -> None:
         """Print multiple labels with cuts between and after last.
 
-        This method prints multiple labels in sequence by calling print() for each label
-        with appropriate parameters.
+        This method prints multiple labels in sequence with the same settings as
+        print(). Labels that appear more than once in the list (e.g. copies) are
+        rendered and encoded only once.
 
         Parameters
         ----------
@@ -708,17 +778,28 @@ class LabelPrinter(ABC):
         cut_type = "half-cut" if half_cut else "full-cut"
         logger.info(f"Printing {len(labels)} labels with {cut_type} between")
 
-        for idx, label in enumerate(labels):
-            is_last = idx == len(labels) - 1
-            logger.info(f"Printing label {idx + 1}/{len(labels)}")
+        high_res = self.high_resolution if high_resolution is None else high_resolution
 
-            self.print(
-                label,
-                margin_mm=margin_mm,
-                high_resolution=high_resolution,
-                feed=is_last,
-                auto_cut=not half_cut,
-                half_cut=half_cut,
-            )
+        # Repeated labels (e.g. copies) are the same object, so encode each only once
+        encoded: dict[int, tuple[int, bytes]] = {}
+
+        # Labels are queued and sent in as few transfers as possible
+        with self._send_job():
+            for idx, label in enumerate(labels):
+                is_last = idx == len(labels) - 1
+                logger.info(f"Printing label {idx + 1}/{len(labels)}")
+
+                if id(label) not in encoded:
+                    encoded[id(label)] = self._encode_label(label, high_res)
+
+                self._print_encoded(
+                    label,
+                    encoded[id(label)],
+                    margin_mm=margin_mm,
+                    high_resolution=high_res,
+                    feed=is_last,
+                    auto_cut=not half_cut,
+                    half_cut=half_cut,
+                )
 
         logger.info(f"Finished printing {len(labels)} labels.")
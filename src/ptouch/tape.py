@@ -5,13 +5,14 @@
 """Tape types for Brother P-touch label printers."""
 
 import warnings
-from abc import ABC
 
 
-class Tape(ABC):
-    """Abstract base class for P-touch tapes.
+class Tape:
+    """Base class for P-touch tapes.
 
-    Subclasses must define width_mm as a class attribute.
+    Subclasses must define width_mm as a class attribute. Tape instances carry
+    no state, so every tape class declares empty ``__slots__`` to keep them
+    free of a per-instance ``__dict__``.
 
     Attributes
     ----------
@@ -19,6 +20,8 @@ class Tape(ABC):
         Width of the tape in millimeters (class attribute).
     """
 
+    __slots__ = ()
+
     width_mm: int
 
 
@@ -28,42 +31,56 @@ class Tape3_5mm(Tape):
     Note: Media size reported by printer is 4mm.
     """
 
+    __slots__ = ()
+
     width_mm = 4
 
 
 class Tape6mm(Tape):
     """6mm tape."""
 
+    __slots__ = ()
+
     width_mm = 6
 
 
 class Tape9mm(Tape):
     """9mm tape."""
 
+    __slots__ = ()
+
     width_mm = 9
 
 
 class Tape12mm(Tape):
     """12mm tape."""
 
+    __slots__ = ()
+
     width_mm = 12
 
 
 class Tape18mm(Tape):
     """18mm tape."""
 
+    __slots__ = ()
+
     width_mm = 18
 
 
 class Tape24mm(Tape):
     """24mm tape."""
 
+    __slots__ = ()
+
     width_mm = 24
 
 
 class Tape36mm(Tape):
     """36mm tape."""
 
+    __slots__ = ()
+
     width_mm = 36
 
 
@@ -76,7 +93,7 @@ class HeatShrinkTube(Tape):
     Note: Heat shrink tubes are NOT supported on PT-P910BT.
     """
 
-    pass
+    __slots__ = ()
 
 
 # =============================================================================
@@ -87,30 +104,40 @@ class HeatShrinkTube(Tape):
 class HeatShrinkTube5_8mm(HeatShrinkTube):
     """5.8mm heat shrink tube (2:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 6  # Media size reported by printer
 
 
 class HeatShrinkTube8_8mm(HeatShrinkTube):
     """8.8mm heat shrink tube (2:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 9  # Media size reported by printer
 
 
 class HeatShrinkTube11_7mm(HeatShrinkTube):
     """11.7mm heat shrink tube (2:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 12  # Media size reported by printer
 
 
 class HeatShrinkTube17_7mm(HeatShrinkTube):
     """17.7mm heat shrink tube (2:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 18  # Media size reported by printer
 
 
 class HeatShrinkTube23_6mm(HeatShrinkTube):
     """23.6mm heat shrink tube (2:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 24  # Media size reported by printer
 
 
@@ -122,30 +149,40 @@ class HeatShrinkTube23_6mm(HeatShrinkTube):
 class HeatShrinkTube3_1_5_2mm(HeatShrinkTube):
     """5.2mm heat shrink tube (3:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 5  # Media size reported by printer
 
 
 class HeatShrinkTube3_1_9_0mm(HeatShrinkTube):
     """9.0mm heat shrink tube (3:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 9  # Media size reported by printer
 
 
 class HeatShrinkTube3_1_11_2mm(HeatShrinkTube):
     """11.2mm heat shrink tube (3:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 11  # Media size reported by printer
 
 
 class HeatShrinkTube3_1_21_0mm(HeatShrinkTube):
     """21.0mm heat shrink tube (3:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 21  # Media size reported by printer
 
 
 class HeatShrinkTube3_1_31_0mm(HeatShrinkTube):
     """31.0mm heat shrink tube (3:1 series)."""
 
+    __slots__ = ()
+
     width_mm = 31  # Media size reported by printer
 
 
@@ -155,15 +192,22 @@ class HeatShrinkTube3_1_31_0mm(HeatShrinkTube):
 
 
 def _deprecated_alias(new_class: type, old_name: str) -> type:
-    """Create a deprecated alias class that warns on instantiation."""
+    """Create a deprecated alias class that warns on its first instantiation."""
 
     class DeprecatedTape(new_class):
+        __slots__ = ()
+
+        _warned = False  # set once the warning was issued for this alias
+
         def __init__(self) -> None:
-            warnings.warn(
-                f"{old_name} is deprecated, use {new_class.__name__} instead",
-                DeprecationWarning,
-                stacklevel=2,
-            )
+            cls = type(self)
+            if not cls._warned:
+                cls._warned = True
+                warnings.warn(
+                    f"{old_name} is deprecated, use {new_class.__name__} instead",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
             super().__init__()
 
     DeprecatedTape.__name__ = old_name
@@ -180,20 +224,44 @@ class LaminatedTape(Tape):
         The LaminatedTape class is deprecated. Use Tape directly.
     """
 
+    __slots__ = ()
+
+    _warned = False  # set once the warning was issued
+
     def __init__(self) -> None:
-        warnings.warn(
-            "LaminatedTape is deprecated, use Tape instead",
-            DeprecationWarning,
-            stacklevel=2,
-        )
+        cls = type(self)
+        if not cls._warned:
+            cls._warned = True
+            warnings.warn(
+                "LaminatedTape is deprecated, use Tape instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         super().__init__()
 
 
-# Deprecated tape size aliases
-LaminatedTape3_5mm = _deprecated_alias(Tape3_5mm, "LaminatedTape3_5mm")
-LaminatedTape6mm = _deprecated_alias(Tape6mm, "LaminatedTape6mm")
-LaminatedTape9mm = _deprecated_alias(Tape9mm, "LaminatedTape9mm")
-LaminatedTape12mm = _deprecated_alias(Tape12mm, "LaminatedTape12mm")
-LaminatedTape18mm = _deprecated_alias(Tape18mm, "LaminatedTape18mm")
-LaminatedTape24mm = _deprecated_alias(Tape24mm, "LaminatedTape24mm")
-LaminatedTape36mm = _deprecated_alias(Tape36mm, "LaminatedTape36mm")
+# Deprecated tape size aliases, created on first access
+_DEPRECATED_ALIASES: dict[str, type[Tape]] = {
+    "LaminatedTape3_5mm": Tape3_5mm,
+    "LaminatedTape6mm": Tape6mm,
+    "LaminatedTape9mm": Tape9mm,
+    "LaminatedTape12mm": Tape12mm,
+    "LaminatedTape18mm": Tape18mm,
+    "LaminatedTape24mm": Tape24mm,
+    "LaminatedTape36mm": Tape36mm,
+}
+
+
+def __getattr__(name: str) -> type:
+    """Create deprecated tape size aliases on first access (PEP 562)."""
+    new_class = _DEPRECATED_ALIASES.get(name)
+    if new_class is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    alias = _deprecated_alias(new_class, name)
+    globals()[name] = alias  # cache so later lookups bypass __getattr__
+    return alias
+
+
+def __dir__() -> list[str]:
+    """List the module names, including deprecated aliases not created yet."""
+    return sorted({*globals(), *_DEPRECATED_ALIASES})
@@ -4,6 +4,8 @@
 
 """Shared test fixtures for ptouch tests."""
 
+import os
+
 import pytest
 from PIL import Image
 
@@ -62,6 +64,23 @@ def sample_image_with_content() -> Image.Image:
     return img
 
 
+@pytest.fixture
+def font_path() -> str:
+    """Return path to a system font for testing."""
+    # Common font paths on various systems
+    font_paths = [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/dejavu-sans-fonts/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+        "C:/Windows/Fonts/arial.ttf",
+    ]
+    for path in font_paths:
+        if os.path.exists(path):
+            return path
+    pytest.skip("No suitable font found for testing")
+
+
 @pytest.fixture
 def tape_6mm() -> Tape6mm:
     """Provide a 6mm tape instance."""
@@ -4,9 +4,21 @@
 
 """Tests for the TapeConfig class and USB constants."""
 
+import dataclasses
+
+import pytest
+
 from ptouch.connection import USB_VENDOR_ID
 from ptouch.printer import TapeConfig
-from ptouch.printers import PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW
+from ptouch.printers import (
+    PTE550W,
+    PTP750W,
+    PTP900,
+    PTP900W,
+    PTP910BT,
+    PTP950NW,
+    find_printer_class,
+)
 
 
 class TestTapeConfig:
@@ -42,6 +54,28 @@ class TestTapeConfig:
         assert "100" in repr_str
         assert "18" in repr_str
 
+    def test_tape_config_is_immutable(self) -> None:
+        """Test that TapeConfig instances cannot be modified."""
+        config = TapeConfig(left_pins=10, print_pins=100, right_pins=18)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.left_pins = 0  # type: ignore[misc]
+
+    def test_tape_config_uses_slots(self) -> None:
+        """Test that TapeConfig instances have no per-instance __dict__."""
+        config = TapeConfig(left_pins=10, print_pins=100, right_pins=18)
+        assert not hasattr(config, "__dict__")
+
+    def test_pin_configs_are_read_only(self) -> None:
+        """Test that printer PIN_CONFIGS cannot be modified."""
+        tape_type = next(iter(PTP900.PIN_CONFIGS))
+        with pytest.raises(TypeError):
+            PTP900.PIN_CONFIGS[tape_type] = TapeConfig(0, 560, 0)  # type: ignore[index]
+
+    def test_p910bt_shares_laminated_configs(self) -> None:
+        """Test that PT-P910BT reuses the P900 series laminated tape configs."""
+        for tape_type, config in PTP910BT.PIN_CONFIGS.items():
+            assert PTP900.PIN_CONFIGS[tape_type] is config
+
     def test_tape_config_importable_from_package(self) -> None:
         """Test that TapeConfig can be imported from ptouch."""
         from ptouch import TapeConfig as ImportedTapeConfig
@@ -93,3 +127,14 @@ class TestUSBConstants:
             PTP950NW.USB_PRODUCT_ID,
         ]
         assert len(ids) == len(set(ids))
+
+    @pytest.mark.parametrize(
+        "printer_class", [PTE550W, PTP750W, PTP900, PTP900W, PTP910BT, PTP950NW]
+    )
+    def test_find_printer_class_by_product_id(self, printer_class: type) -> None:
+        """Test that each printer class is found by its USB product ID."""
+        assert find_printer_class(printer_class.USB_PRODUCT_ID) is printer_class
+
+    def test_find_printer_class_unknown_product_id(self) -> None:
+        """Test that an unknown product ID returns None."""
+        assert find_printer_class(0xFFFF) is None
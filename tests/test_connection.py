@@ -4,12 +4,22 @@
 
 """Tests for the ptouch.connection module."""
 
+import errno
 import socket
+import sys
+import threading
+import time
+from array import array
+from collections import defaultdict
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import usb.core
 
 from ptouch.connection import (
+    NETWORK_POOL_SIZE,
+    USB_DEVICE_CACHE_TTL,
     ConnectionNetwork,
     ConnectionUSB,
     PrinterConnectionError,
@@ -18,9 +28,14 @@ from ptouch.connection import (
     PrinterPermissionError,
     PrinterTimeoutError,
     PrinterWriteError,
+    _match_endpoint_in,
+    _match_endpoint_out,
+    _retry_delay,
     parse_usb_uri,
 )
 
+from .conftest import MockConnection
+
 
 class MockPrinter:
     """Mock printer for testing USB connections."""
@@ -34,6 +49,169 @@ class MockPrinterNoUSB:
     pass
 
 
+# Both mock printers are stateless, so every test shares one instance
+MOCK_PRINTER = MockPrinter()
+MOCK_PRINTER_NO_USB = MockPrinterNoUSB()
+
+
+class MockSocket:
+    """Socket stand-in that records what is sent instead of using the network.
+
+    Failures are scripted with ``connect_error``, ``recv_error`` and
+    ``setsockopt_error``, or by queueing ``send_results``: each send() or
+    sendmsg() call takes the next entry and raises it if it is an exception,
+    or sends at most that many bytes otherwise. With the queue empty, every
+    call sends all data. ``peer_closed`` and ``so_error`` mark a socket
+    whose printer hung up or failed.
+    """
+
+    __slots__ = (
+        "closed",
+        "connect_error",
+        "connected_to",
+        "options",
+        "peer_closed",
+        "recv_error",
+        "send_calls",
+        "send_results",
+        "sent",
+        "setsockopt_error",
+        "so_error",
+        "timeout",
+    )
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.connect_error: Exception | None = None
+        self.connected_to: tuple[str, int] | None = None
+        self.options: list[tuple[int, int, int]] = []
+        self.peer_closed = False
+        self.recv_error: Exception | None = None
+        self.send_calls: list[list[bytes]] = []  # chunks offered per call
+        self.send_results: list[int | Exception] = []
+        self.sent = bytearray()
+        self.setsockopt_error: Exception | None = None
+        self.so_error = 0
+        self.timeout: float | None = None
+
+    def settimeout(self, timeout: float) -> None:
+        """Record the timeout."""
+        self.timeout = timeout
+
+    def setblocking(self, flag: bool) -> None:
+        """Record blocking mode as a timeout, like a real socket."""
+        self.timeout = None if flag else 0.0
+
+    def getsockopt(self, level: int, option: int) -> int:
+        """Return the scripted pending error for SO_ERROR."""
+        del level, option  # unused
+        return self.so_error
+
+    def setsockopt(self, level: int, option: int, value: int) -> None:
+        """Record a socket option."""
+        if self.setsockopt_error is not None:
+            raise self.setsockopt_error
+        self.options.append((level, option, value))
+
+    def connect(self, address: tuple[str, int]) -> None:
+        """Record the address instead of connecting."""
+        if self.connect_error is not None:
+            raise self.connect_error
+        self.connected_to = address
+
+    def send(self, data: bytes | memoryview) -> int:
+        """Capture data instead of sending it."""
+        return self._send([bytes(data)])
+
+    def sendmsg(self, buffers: list[memoryview]) -> int:
+        """Capture the gathered buffers instead of sending them."""
+        return self._send([bytes(buffer) for buffer in buffers])
+
+    def recv(self, num_bytes: int, flags: int = 0) -> bytes:
+        """Return no data, as if the printer had nothing to report."""
+        del num_bytes, flags  # unused
+        if self.recv_error is not None:
+            raise self.recv_error
+        if self.timeout == 0.0 and not self.peer_closed:
+            raise BlockingIOError
+        return b""
+
+    def close(self) -> None:
+        """Mark socket as closed."""
+        self.closed = True
+
+    def _send(self, chunks: list[bytes]) -> int:
+        self.send_calls.append(chunks)
+        data = b"".join(chunks)
+        if self.send_results:
+            result = self.send_results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            data = data[:result]
+        self.sent += data
+        return len(data)
+
+
+class MockEndpoint:
+    """USB OUT endpoint stand-in that records writes.
+
+    Each write() takes the next entry of ``results`` and raises it if it is an
+    exception, or returns it as the number of bytes written. With the queue
+    empty, every write succeeds in full.
+    """
+
+    __slots__ = ("results", "written")
+
+    def __init__(self) -> None:
+        self.results: list[int | Exception] = []
+        self.written: "list[array[int]]" = []
+
+    def write(self, data: "array[int]", timeout: int | None = None) -> int:
+        """Capture data instead of sending it."""
+        del timeout  # unused
+        self.written.append(data)
+        if self.results:
+            result = self.results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        return len(data)
+
+
+@pytest.fixture
+def mock_sock(monkeypatch: pytest.MonkeyPatch) -> MockSocket:
+    """Provide the socket that ConnectionNetwork.connect() creates."""
+    sock = MockSocket()
+    monkeypatch.setattr("socket.socket", lambda *args: sock)
+    return sock
+
+
+@pytest.fixture
+def connected_network(mock_sock: MockSocket) -> ConnectionNetwork:
+    """Create a ConnectionNetwork connected to the mocked socket."""
+    conn = ConnectionNetwork("192.168.1.100")
+    conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+    return conn
+
+
+@pytest.fixture(autouse=True)
+def _clear_connection_caches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give every test an empty USB device cache and network socket pool."""
+    monkeypatch.setattr("ptouch.connection._USB_DEVICE_CACHE", {})
+    monkeypatch.setattr("ptouch.connection._NET_POOL", defaultdict(list))
+
+
+@pytest.fixture
+def usb_find(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Patch pyusb so connect() finds a mocked printer; returns the mocked usb.core.find."""
+    device = MagicMock()
+    device.is_kernel_driver_active.return_value = False
+    find = MagicMock(return_value=device)
+    monkeypatch.setattr("usb.core.find", find)
+    monkeypatch.setattr("usb.util.find_descriptor", lambda *args, **kwargs: MockEndpoint())
+    return find
+
+
 class TestPrinterConnectionError:
     """Test PrinterConnectionError exception."""
 
@@ -42,6 +220,13 @@ class TestPrinterConnectionError:
         error = PrinterConnectionError("Test error message")
         assert str(error) == "Test error message"
         assert error.original_error is None
+        assert error.host is None
+        assert error.port is None
+
+    def test_exception_with_host_and_port(self) -> None:
+        """Test that exception stores the network printer address."""
+        error = PrinterTimeoutError("Timed out", host="printer.local", port=9100)
+        assert (error.host, error.port) == ("printer.local", 9100)
 
     def test_exception_with_original_error(self) -> None:
         """Test that exception stores original error."""
@@ -61,12 +246,14 @@ class TestPrinterExceptionHierarchy:
     """Test exception hierarchy and inheritance."""
 
     def test_all_exceptions_inherit_from_base(self) -> None:
-        """Test that all specific exceptions inherit from PrinterConnectionError."""
-        assert issubclass(PrinterNotFoundError, PrinterConnectionError)
-        assert issubclass(PrinterPermissionError, PrinterConnectionError)
-        assert issubclass(PrinterNetworkError, PrinterConnectionError)
-        assert issubclass(PrinterTimeoutError, PrinterConnectionError)
-        assert issubclass(PrinterWriteError, PrinterConnectionError)
+        """Test that all specific exceptions inherit directly from PrinterConnectionError."""
+        assert {
+            PrinterNotFoundError,
+            PrinterPermissionError,
+            PrinterNetworkError,
+            PrinterTimeoutError,
+            PrinterWriteError,
+        } <= set(PrinterConnectionError.__subclasses__())
 
     def test_exceptions_are_importable_from_package(self) -> None:
         """Test that all exceptions can be imported from ptouch package."""
@@ -122,34 +309,111 @@ class TestConnectionUSBInit:
         """Test that connect() raises error if printer has no USB_PRODUCT_ID."""
         conn = ConnectionUSB()
         with pytest.raises(PrinterConnectionError) as exc_info:
-            conn.connect(MockPrinterNoUSB())  # type: ignore[arg-type]
+            conn.connect(MOCK_PRINTER_NO_USB)  # type: ignore[arg-type]
 
         assert "USB_PRODUCT_ID" in str(exc_info.value)
 
-    def test_usb_connect_with_mock_printer(self) -> None:
+    def test_usb_connect_with_mock_printer(self, usb_find: MagicMock) -> None:
         """Test that connect() uses printer's USB_PRODUCT_ID."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+        conn = ConnectionUSB()
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        # Should have called usb.core.find with the product ID from MockPrinter
+        usb_find.assert_called_once()
+        assert usb_find.call_args.kwargs["idProduct"] == 0x1234
+
+    def test_usb_connect_without_pyusb_raises(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that connect() explains how to install pyusb when it is missing."""
+        monkeypatch.setitem(sys.modules, "usb.core", None)
+        conn = ConnectionUSB()
+        with pytest.raises(PrinterConnectionError, match=r"ptouch\[usb\]") as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert isinstance(exc_info.value.original_error, ImportError)
+
+
+class TestEndpointMatching:
+    """Test USB endpoint direction matching."""
+
+    @pytest.mark.parametrize(("address", "is_in"), [(0x81, True), (0x02, False)])
+    def test_endpoint_direction(self, address: int, is_in: bool) -> None:
+        """Test that endpoints are matched by the direction bit of their address."""
+        endpoint = SimpleNamespace(bEndpointAddress=address)
+        assert _match_endpoint_in(endpoint) is is_in
+        assert _match_endpoint_out(endpoint) is not is_in
+
 
-            mock_intf = MagicMock()
-            mock_intf.bInterfaceClass = 7
+class TestContextManager:
+    """Test closing connections with a with-statement."""
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+    def test_with_block_closes_connection(self) -> None:
+        """Test that leaving the block closes the connection."""
+        with MockConnection() as conn:
+            assert not conn.closed
+        assert conn.closed
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+    def test_with_block_closes_connection_on_error(self) -> None:
+        """Test that the connection is closed when the block raises."""
+        conn = MockConnection()
+        with pytest.raises(RuntimeError):
+            with conn:
+                raise RuntimeError("print failed")
+        assert conn.closed
 
-                conn = ConnectionUSB()
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
 
-                # Should have called usb.core.find with the product ID from MockPrinter
-                mock_find.assert_called_once()
-                call_kwargs = mock_find.call_args[1]
-                assert call_kwargs["idProduct"] == 0x1234
+class TestConnectionUSBWrite:
+    """Test ConnectionUSB write method."""
+
+    def test_payload_converted_once_across_retries(self) -> None:
+        """Test that the same array('B') buffer is reused for every attempt."""
+        conn = ConnectionUSB()
+        conn._ep_out = endpoint = MockEndpoint()
+        endpoint.results = [usb.core.USBError("stall"), 9]
+
+        with patch("time.sleep"):
+            conn.write(b"test data")
+
+        first, second = endpoint.written
+        assert first is second
+        assert first.typecode == "B"
+        assert first.tobytes() == b"test data"
+
+    def test_writev_sends_chunks_as_one_array(self) -> None:
+        """Test that writev() fills a single array('B') from all chunks."""
+        conn = ConnectionUSB()
+        conn._ep_out = endpoint = MockEndpoint()
+
+        conn.writev([b"test", b" ", b"data"])
+
+        (sent,) = endpoint.written
+        assert sent.typecode == "B"
+        assert sent.tobytes() == b"test data"
+
+    def test_incomplete_write_raises(self) -> None:
+        """Test that a short write raises PrinterWriteError without retrying."""
+        conn = ConnectionUSB()
+        conn._ep_out = endpoint = MockEndpoint()
+        endpoint.results = [4]
+
+        with pytest.raises(PrinterWriteError, match="4/9 bytes"):
+            conn.write(b"test data")
+        assert len(endpoint.written) == 1
+
+    @pytest.mark.parametrize("error_code", [errno.EACCES, errno.ENODEV, errno.ENOENT])
+    def test_unrecoverable_error_not_retried(self, error_code: int) -> None:
+        """Test that errors retrying cannot fix fail at once, without sleeping."""
+        conn = ConnectionUSB()
+        conn._ep_out = endpoint = MockEndpoint()
+        error = usb.core.USBError("gone", errno=error_code)
+        endpoint.results = [error]
+
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(PrinterWriteError) as exc_info:
+                conn.write(b"test data")
+
+        assert len(endpoint.written) == 1
+        mock_sleep.assert_not_called()
+        assert exc_info.value.original_error is error
 
 
 class TestConnectionNetworkInit:
@@ -168,132 +432,271 @@ class TestConnectionNetworkInit:
         conn = ConnectionNetwork("192.168.1.100")
         assert conn.timeout == 5.0
 
-    def test_connect_establishes_socket(self) -> None:
+    def test_connect_establishes_socket(self, mock_sock: MockSocket) -> None:
         """Test that connect() creates and configures socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-
-            conn = ConnectionNetwork("192.168.1.100", timeout=10.0)
-            conn.connect(MockPrinter())  # type: ignore[arg-type]
+        conn = ConnectionNetwork("192.168.1.100", timeout=10.0)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            mock_sock.settimeout.assert_called_with(10.0)
-            mock_sock.connect.assert_called_once_with(("192.168.1.100", 9100))
+        assert mock_sock.timeout == 10.0
+        assert mock_sock.connected_to == ("192.168.1.100", 9100)
 
-    def test_connection_timeout_raises_printer_error(self) -> None:
+    def test_connection_timeout_raises_printer_error(self, mock_sock: MockSocket) -> None:
         """Test that connection timeout raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = socket.timeout("timed out")
-
-            conn = ConnectionNetwork("192.168.1.100", timeout=5.0)
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        mock_sock.connect_error = socket.timeout("timed out")
+        conn = ConnectionNetwork("192.168.1.100", timeout=5.0)
+        with pytest.raises(PrinterTimeoutError) as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            assert "timed out" in str(exc_info.value)
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, socket.timeout)
-            mock_sock.close.assert_called_once()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
+        assert isinstance(exc_info.value.original_error, socket.timeout)
+        assert mock_sock.closed
 
-    def test_connection_refused_raises_printer_error(self) -> None:
+    def test_connection_refused_raises_printer_error(self, mock_sock: MockSocket) -> None:
         """Test that connection refused raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = ConnectionRefusedError("Connection refused")
-
-            conn = ConnectionNetwork("192.168.1.100")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        mock_sock.connect_error = ConnectionRefusedError("Connection refused")
+        conn = ConnectionNetwork("192.168.1.100")
+        with pytest.raises(PrinterNetworkError) as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            assert "refused" in str(exc_info.value).lower()
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, ConnectionRefusedError)
-            mock_sock.close.assert_called_once()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
+        assert isinstance(exc_info.value.original_error, ConnectionRefusedError)
+        assert mock_sock.closed
 
-    def test_hostname_resolution_error_raises_printer_error(self) -> None:
+    def test_hostname_resolution_error_raises_printer_error(self, mock_sock: MockSocket) -> None:
         """Test that hostname resolution failure raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = socket.gaierror(8, "Name not resolved")
-
-            conn = ConnectionNetwork("invalid.hostname.local")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        mock_sock.connect_error = socket.gaierror(8, "Name not resolved")
+        conn = ConnectionNetwork("invalid.hostname.local")
+        with pytest.raises(PrinterNetworkError) as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            assert "invalid.hostname.local" in str(exc_info.value)
-            assert "resolve" in str(exc_info.value).lower()
-            assert isinstance(exc_info.value.original_error, socket.gaierror)
-            mock_sock.close.assert_called_once()
+        assert exc_info.value.host == "invalid.hostname.local"
+        assert isinstance(exc_info.value.original_error, socket.gaierror)
+        assert mock_sock.closed
 
-    def test_generic_os_error_raises_printer_error(self) -> None:
+    def test_generic_os_error_raises_printer_error(self, mock_sock: MockSocket) -> None:
         """Test that generic OSError raises PrinterConnectionError."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            mock_sock.connect.side_effect = OSError("Network unreachable")
+        mock_sock.connect_error = OSError("Network unreachable")
+        conn = ConnectionNetwork("192.168.1.100")
+        with pytest.raises(PrinterNetworkError) as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
+        assert isinstance(exc_info.value.original_error, OSError)
+        assert mock_sock.closed
+
+
+class TestConnectionNetworkPool:
+    """Test reuse of released sockets across ConnectionNetwork instances."""
+
+    @pytest.fixture
+    def new_socket(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Patch socket.socket to hand out a fresh MockSocket per call."""
+        factory = MagicMock(side_effect=lambda *args: MockSocket())
+        monkeypatch.setattr("socket.socket", factory)
+        return factory
+
+    def _release(self, host: str = "192.168.1.100") -> MockSocket:
+        conn = ConnectionNetwork(host)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        sock = conn._socket
+        conn.release()
+        assert conn._socket is None
+        return sock  # type: ignore[return-value]
+
+    def test_connect_reuses_released_socket(self, new_socket: MagicMock) -> None:
+        """Test that a released socket is reused by the next connection to the printer."""
+        released = self._release()
+
+        conn = ConnectionNetwork("192.168.1.100", timeout=3.0)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert conn._socket is released
+        assert not released.closed
+        assert released.timeout == 3.0
+        assert new_socket.call_count == 1
+
+    def test_pool_is_per_printer(self, new_socket: MagicMock) -> None:
+        """Test that a socket is only reused for the same host and port."""
+        released = self._release()
+
+        conn = ConnectionNetwork("192.168.1.101")
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert conn._socket is not released
+        assert new_socket.call_count == 2
+
+    @pytest.mark.parametrize("attribute", ["peer_closed", "so_error"])
+    def test_dead_socket_is_discarded(self, new_socket: MagicMock, attribute: str) -> None:
+        """Test that a pooled socket the printer closed is not reused."""
+        released = self._release()
+        setattr(released, attribute, True)
 
-            conn = ConnectionNetwork("192.168.1.100")
-            with pytest.raises(PrinterConnectionError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        conn = ConnectionNetwork("192.168.1.100")
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert conn._socket is not released
+        assert released.closed
+        assert new_socket.call_count == 2
+
+    def test_release_closes_socket_when_pool_full(self, new_socket: MagicMock) -> None:
+        """Test that release() closes the socket once the pool for the printer is full."""
+        conns = [ConnectionNetwork("192.168.1.100") for _ in range(NETWORK_POOL_SIZE + 1)]
+        for conn in conns:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        sockets = [conn._socket for conn in conns]
+        for conn in conns:
+            conn.release()
 
-            assert "192.168.1.100:9100" in str(exc_info.value)
-            assert isinstance(exc_info.value.original_error, OSError)
-            mock_sock.close.assert_called_once()
+        assert [sock.closed for sock in sockets] == [False] * NETWORK_POOL_SIZE + [True]  # type: ignore[union-attr]
+
+    def test_close_does_not_pool_socket(self, new_socket: MagicMock) -> None:
+        """Test that close() closes the socket instead of returning it to the pool."""
+        conn = ConnectionNetwork("192.168.1.100")
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        conn.close()
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert new_socket.call_count == 2
+
+
+class TestWriteBuffered:
+    """Test Connection.write_buffered and flush."""
+
+    def test_flush_writes_queued_data_once(self) -> None:
+        """Test that queued chunks are sent as one write on flush."""
+        conn = MockConnection()
+        with patch.object(conn, "write") as mock_write:
+            conn.write_buffered(b"abc")
+            conn.write_buffered(b"def")
+            mock_write.assert_not_called()
+            conn.flush()
+            conn.flush()
+        mock_write.assert_called_once_with(b"abcdef")
+
+    def test_full_buffer_is_written_in_background(self) -> None:
+        """Test that reaching WRITE_BUFFER_SIZE hands the data to the writer thread."""
+        conn = MockConnection()
+        threads: list[str] = []
+        write = conn.write
+
+        def recording_write(payload: bytes) -> None:
+            threads.append(threading.current_thread().name)
+            write(payload)
+
+        with patch.object(conn, "write", recording_write):
+            conn.write_buffered(b"x" * (conn.WRITE_BUFFER_SIZE - 1))
+            assert conn._writer is None
+            conn.write_buffered(b"yz")
+            assert conn._writer is not None
+            conn.write_buffered(b"tail")
+            conn.flush()
+
+        assert conn.data == b"x" * (conn.WRITE_BUFFER_SIZE - 1) + b"yztail"
+        assert all(name.startswith("ptouch-write") for name in threads)
+        assert conn._writer is None
+
+    def test_background_write_error_is_raised_on_flush(self) -> None:
+        """Test that a failed background write is raised by flush() and later data dropped."""
+        conn = MockConnection()
+        calls: list[bytes] = []
+
+        def failing_write(payload: bytes) -> None:
+            calls.append(payload)
+            raise PrinterWriteError("USB write failed")
+
+        with patch.object(conn, "write", failing_write):
+            conn.write_buffered(b"a" * conn.WRITE_BUFFER_SIZE)
+            conn.write_buffered(b"b" * conn.WRITE_BUFFER_SIZE)
+            with pytest.raises(PrinterWriteError):
+                conn.flush()
+
+        assert len(calls) == 1
+        conn.write_buffered(b"next job")
+        conn.flush()
+        assert conn.data == b"next job"
+
+    def test_discard_drops_unsent_data(self) -> None:
+        """Test that discard() drops queued chunks, including those waiting for the writer."""
+        conn = MockConnection()
+        started = threading.Event()
+        release = threading.Event()
+        write = conn.write
+
+        def blocking_write(payload: bytes) -> None:
+            started.set()
+            release.wait()
+            write(payload)
+
+        with patch.object(conn, "write", blocking_write):
+            conn.write_buffered(b"a" * conn.WRITE_BUFFER_SIZE)
+            started.wait()
+            conn.write_buffered(b"b" * conn.WRITE_BUFFER_SIZE)
+            conn.write_buffered(b"tail")
+            pending = list(conn._pending_writes or [])
+            discard = threading.Thread(target=conn.discard)
+            discard.start()
+            while not pending[1].cancelled():
+                time.sleep(0.001)
+            release.set()
+            discard.join()
+
+        assert conn.data == b"a" * conn.WRITE_BUFFER_SIZE
+        assert conn._writer is None
+        conn.write_buffered(b"next job")
+        conn.flush()
+        assert conn.data == b"a" * conn.WRITE_BUFFER_SIZE + b"next job"
 
 
 class TestConnectionNetworkWrite:
     """Test ConnectionNetwork write method error handling."""
 
-    @pytest.fixture
-    def connected_network(self) -> ConnectionNetwork:
-        """Create a ConnectionNetwork with mocked socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            conn = ConnectionNetwork("192.168.1.100")
-            conn.connect(MockPrinter())  # type: ignore[arg-type]
-            return conn
-
-    def test_write_timeout_raises_printer_error(self, connected_network: ConnectionNetwork) -> None:
+    def test_write_timeout_raises_printer_error(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
         """Test that write timeout raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = socket.timeout("timed out")
+        mock_sock.send_results = [socket.timeout("timed out")] * 3
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
+        with patch("time.sleep"), pytest.raises(PrinterTimeoutError) as exc_info:
             connected_network.write(b"test data")
 
-        assert "timed out" in str(exc_info.value).lower()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
         assert isinstance(exc_info.value.original_error, socket.timeout)
 
     def test_write_broken_pipe_raises_printer_error(
-        self, connected_network: ConnectionNetwork
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
     ) -> None:
         """Test that broken pipe raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = BrokenPipeError("Broken pipe")
+        mock_sock.send_results = [BrokenPipeError("Broken pipe")] * 3
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
+        with patch("time.sleep"), pytest.raises(PrinterNetworkError) as exc_info:
             connected_network.write(b"test data")
 
-        assert "lost" in str(exc_info.value).lower()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
         assert isinstance(exc_info.value.original_error, BrokenPipeError)
 
     def test_write_connection_reset_raises_printer_error(
-        self, connected_network: ConnectionNetwork
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
     ) -> None:
         """Test that connection reset raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.sendall.side_effect = ConnectionResetError("Connection reset")
+        mock_sock.send_results = [ConnectionResetError("Connection reset")] * 3
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
+        with patch("time.sleep"), pytest.raises(PrinterNetworkError) as exc_info:
             connected_network.write(b"test data")
 
-        assert "lost" in str(exc_info.value).lower()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
         assert isinstance(exc_info.value.original_error, ConnectionResetError)
 
+    def test_write_resumes_after_partial_send_and_timeout(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that a retry sends only the bytes the printer has not received."""
+        mock_sock.send_results = [4, socket.timeout("timed out"), 5]
+        with patch("time.sleep"):
+            connected_network.write(b"test data")
+
+        assert mock_sock.send_calls[-1] == [b" data"]
+        assert mock_sock.sent == b"test data"
+
     def test_write_not_connected_raises_printer_error(self) -> None:
         """Test that write before connect raises PrinterConnectionError."""
         conn = ConnectionNetwork("192.168.1.100")
@@ -303,41 +706,123 @@ class TestConnectionNetworkWrite:
         assert "Not connected" in str(exc_info.value)
 
 
+class TestRetryDelay:
+    """Test the retry backoff schedule."""
+
+    def test_delay_grows_exponentially(self) -> None:
+        """Test that the delay doubles per attempt without jitter."""
+        with patch("ptouch.connection.random.random", return_value=0.0):
+            assert [_retry_delay(attempt) for attempt in range(4)] == [0.05, 0.1, 0.2, 0.4]
+
+    def test_delay_is_capped_and_jittered(self) -> None:
+        """Test that the delay is capped and jitter adds at most RETRY_JITTER."""
+        with patch("ptouch.connection.random.random", return_value=1.0):
+            assert _retry_delay(20) == pytest.approx(2.0 * 1.5)
+
+    def test_network_write_retries_with_backoff(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that a timed-out network write sleeps with backoff between attempts."""
+        mock_sock.send_results = [socket.timeout("timed out")] * 3
+
+        with (
+            patch("ptouch.connection.random.random", return_value=0.0),
+            patch("time.sleep") as mock_sleep,
+            pytest.raises(PrinterTimeoutError),
+        ):
+            connected_network.write(b"test data", retries=3)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.05, 0.1]
+
+
+class TestConnectionNetworkWritev:
+    """Test ConnectionNetwork gathering writes."""
+
+    @pytest.mark.usefixtures("connected_network")
+    def test_connect_sets_send_buffer_size(self, mock_sock: MockSocket) -> None:
+        """Test that connect() enlarges the socket send buffer."""
+        option = (socket.SOL_SOCKET, socket.SO_SNDBUF, ConnectionNetwork.SEND_BUFFER_SIZE)
+        assert option in mock_sock.options
+
+    def test_partial_sends_are_resumed(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that partially sent chunks are resent from where they stopped."""
+        mock_sock.send_results = [4, 4, 4]  # send at most 4 bytes per call
+        connected_network.writev([b"head", b"", b"raster", b"\x1a"])
+        assert mock_sock.send_calls[1] == [b"raster", b"\x1a"]
+        assert mock_sock.sent == b"headraster\x1a"
+
+    def test_timeout_resumes_without_resending(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that a timed-out send is retried from the unsent data."""
+        mock_sock.send_results = [3, socket.timeout("timed out"), 6]
+        with patch("time.sleep"):
+            connected_network.writev([b"abc", b"def", b"ghi"])
+        assert mock_sock.send_calls[-1] == [b"def", b"ghi"]
+        assert mock_sock.sent == b"abcdefghi"
+
+    def test_falls_back_to_write_without_sendmsg(
+        self,
+        connected_network: ConnectionNetwork,
+        mock_sock: MockSocket,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that chunks are joined and sent with send() without sendmsg()."""
+        monkeypatch.delattr(MockSocket, "sendmsg")
+        connected_network.writev([b"abc", b"def"])
+        assert mock_sock.send_calls == [[b"abcdef"]]
+
+    @pytest.mark.skipif(not hasattr(socket, "TCP_CORK"), reason="TCP_CORK not available")
+    def test_burst_corks_and_uncorks_socket(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that begin_burst/end_burst toggle TCP_CORK."""
+        connected_network.begin_burst()
+        assert mock_sock.options[-1] == (socket.IPPROTO_TCP, socket.TCP_CORK, 1)
+        connected_network.end_burst()
+        assert mock_sock.options[-1] == (socket.IPPROTO_TCP, socket.TCP_CORK, 0)
+
+    def test_end_burst_ignores_socket_errors(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
+        """Test that a failing uncork does not raise."""
+        mock_sock.setsockopt_error = OSError("bad fd")
+        connected_network.end_burst()
+
+    def test_writev_not_connected_raises_printer_error(self) -> None:
+        """Test that writev before connect raises PrinterConnectionError."""
+        conn = ConnectionNetwork("192.168.1.100")
+        with pytest.raises(PrinterConnectionError, match="Not connected"):
+            conn.writev([b"test data"])
+
+
 class TestConnectionNetworkRead:
     """Test ConnectionNetwork read method error handling."""
 
-    @pytest.fixture
-    def connected_network(self) -> ConnectionNetwork:
-        """Create a ConnectionNetwork with mocked socket."""
-        with patch("socket.socket") as mock_socket:
-            mock_sock = MagicMock()
-            mock_socket.return_value = mock_sock
-            conn = ConnectionNetwork("192.168.1.100")
-            conn.connect(MockPrinter())  # type: ignore[arg-type]
-            return conn
-
-    def test_read_timeout_raises_printer_error(self, connected_network: ConnectionNetwork) -> None:
+    def test_read_timeout_raises_printer_error(
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
+    ) -> None:
         """Test that read timeout raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.recv.side_effect = socket.timeout("timed out")
+        mock_sock.recv_error = socket.timeout("timed out")
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
+        with pytest.raises(PrinterTimeoutError) as exc_info:
             connected_network.read()
 
-        assert "timed out" in str(exc_info.value).lower()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
         assert isinstance(exc_info.value.original_error, socket.timeout)
 
     def test_read_broken_pipe_raises_printer_error(
-        self, connected_network: ConnectionNetwork
+        self, connected_network: ConnectionNetwork, mock_sock: MockSocket
     ) -> None:
         """Test that broken pipe raises PrinterConnectionError."""
-        assert connected_network._socket is not None
-        connected_network._socket.recv.side_effect = BrokenPipeError("Broken pipe")
+        mock_sock.recv_error = BrokenPipeError("Broken pipe")
 
-        with pytest.raises(PrinterConnectionError) as exc_info:
+        with pytest.raises(PrinterNetworkError) as exc_info:
             connected_network.read()
 
-        assert "lost" in str(exc_info.value).lower()
+        assert (exc_info.value.host, exc_info.value.port) == ("192.168.1.100", 9100)
         assert isinstance(exc_info.value.original_error, BrokenPipeError)
 
     def test_read_not_connected_raises_printer_error(self) -> None:
@@ -452,97 +937,155 @@ class TestConnectionUSBParams:
         assert conn._product_id == 0x2086
         assert conn._serial == "ABC123"
 
-    def test_connect_uses_explicit_product_id(self) -> None:
+    def test_connect_uses_explicit_product_id(self, usb_find: MagicMock) -> None:
         """Test that connect() uses explicit product_id over printer's USB_PRODUCT_ID."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+        conn = ConnectionUSB(product_id=0x9999)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+        call_kwargs = usb_find.call_args.kwargs
+        # Should use explicit product_id, not MockPrinter's 0x1234
+        assert call_kwargs["idProduct"] == 0x9999
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+    def test_connect_uses_explicit_vendor_id(self, usb_find: MagicMock) -> None:
+        """Test that connect() uses explicit vendor_id."""
+        conn = ConnectionUSB(vendor_id=0x1234, product_id=0x5678)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-                conn = ConnectionUSB(product_id=0x9999)
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        call_kwargs = usb_find.call_args.kwargs
+        assert call_kwargs["idVendor"] == 0x1234
+        assert call_kwargs["idProduct"] == 0x5678
 
-                call_kwargs = mock_find.call_args[1]
-                # Should use explicit product_id, not MockPrinter's 0x1234
-                assert call_kwargs["idProduct"] == 0x9999
+    def test_connect_uses_serial_number(self, usb_find: MagicMock) -> None:
+        """Test that connect() passes serial_number to usb.core.find."""
+        conn = ConnectionUSB(product_id=0x2086, serial="ABC123")
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        call_kwargs = usb_find.call_args.kwargs
+        assert call_kwargs["serial_number"] == "ABC123"
+
+    @pytest.mark.parametrize(
+        ("platform", "side_effect", "probed"),
+        [
+            ("linux", None, True),
+            ("linux", NotImplementedError, True),
+            ("win32", None, False),
+            ("darwin", None, False),
+        ],
+    )
+    def test_connect_kernel_driver_probe(
+        self,
+        usb_find: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+        platform: str,
+        side_effect: type[Exception] | None,
+        probed: bool,
+    ) -> None:
+        """Test that the kernel driver probe is skipped or tolerated where unsupported."""
+        monkeypatch.setattr("sys.platform", platform)
+        mock_device = usb_find.return_value
+        mock_device.is_kernel_driver_active.side_effect = side_effect
 
-    def test_connect_uses_explicit_vendor_id(self) -> None:
-        """Test that connect() uses explicit vendor_id."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+        conn = ConnectionUSB(product_id=0x2086)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+        assert mock_device.is_kernel_driver_active.called is probed
+        mock_device.detach_kernel_driver.assert_not_called()
+        assert conn._kernel_driver_detached is False
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+    def test_not_found_error_includes_serial(self, usb_find: MagicMock) -> None:
+        """Test that PrinterNotFoundError includes serial when device not found."""
+        usb_find.return_value = None
 
-                conn = ConnectionUSB(vendor_id=0x1234, product_id=0x5678)
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        conn = ConnectionUSB(product_id=0x2086, serial="ABC123")
+        with pytest.raises(PrinterNotFoundError) as exc_info:
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-                call_kwargs = mock_find.call_args[1]
-                assert call_kwargs["idVendor"] == 0x1234
-                assert call_kwargs["idProduct"] == 0x5678
+        assert "ABC123" in str(exc_info.value)
+        assert "0x2086" in str(exc_info.value).lower()
 
-    def test_connect_uses_serial_number(self) -> None:
-        """Test that connect() passes serial_number to usb.core.find."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+    def test_connect_without_product_id_uses_printer_class(self, usb_find: MagicMock) -> None:
+        """Test that connect() falls back to printer's USB_PRODUCT_ID."""
+        conn = ConnectionUSB()  # No explicit product_id
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+        call_kwargs = usb_find.call_args.kwargs
+        # Should use MockPrinter's USB_PRODUCT_ID
+        assert call_kwargs["idProduct"] == 0x1234
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+    def test_reconnect_reuses_closed_device(
+        self, usb_find: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that reconnecting within the TTL after close() skips the USB bus scan."""
+        disposed: list[object] = []
+        monkeypatch.setattr("usb.util.dispose_resources", disposed.append)
+        conn = ConnectionUSB(product_id=0x2086)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        conn.close()
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert usb_find.call_count == 1
+        assert conn._device is usb_find.return_value
+        assert disposed == [usb_find.return_value]
+
+    def test_open_connections_do_not_share_device(self, usb_find: MagicMock) -> None:
+        """Test that a device is not handed to a second connection while still open."""
+        first = ConnectionUSB(product_id=0x2086)
+        first.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        usb_find.return_value = MagicMock(**{"is_kernel_driver_active.return_value": False})
+        second = ConnectionUSB(product_id=0x2086)
+        second.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+
+        assert usb_find.call_count == 2
+        assert second._device is not first._device
+
+    def test_cached_device_expires(
+        self, usb_find: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the USB bus is scanned again once the cache entry expired."""
+        clock = iter([100.0, 100.0 + USB_DEVICE_CACHE_TTL])
+        monkeypatch.setattr("time.monotonic", lambda: next(clock))
 
-                conn = ConnectionUSB(product_id=0x2086, serial="ABC123")
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        conn = ConnectionUSB(product_id=0x2086)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        conn.close()
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-                call_kwargs = mock_find.call_args[1]
-                assert call_kwargs["serial_number"] == "ABC123"
+        assert usb_find.call_count == 2
 
-    def test_not_found_error_includes_serial(self) -> None:
-        """Test that PrinterNotFoundError includes serial when device not found."""
-        with patch("usb.core.find") as mock_find:
-            mock_find.return_value = None
+    def test_cache_keyed_by_serial(self, usb_find: MagicMock) -> None:
+        """Test that printers with different serial numbers are looked up separately."""
+        first = ConnectionUSB(product_id=0x2086, serial="A")
+        first.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        first.close()
+        ConnectionUSB(product_id=0x2086, serial="B").connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            conn = ConnectionUSB(product_id=0x2086, serial="ABC123")
-            with pytest.raises(PrinterNotFoundError) as exc_info:
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        assert usb_find.call_count == 2
 
-            assert "ABC123" in str(exc_info.value)
-            assert "0x2086" in str(exc_info.value).lower()
+    def test_not_found_is_not_cached(self, usb_find: MagicMock) -> None:
+        """Test that a missing printer is found once it has been plugged in."""
+        device = usb_find.return_value
+        usb_find.return_value = None
+        conn = ConnectionUSB(product_id=0x2086)
+        with pytest.raises(PrinterNotFoundError):
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-    def test_connect_without_product_id_uses_printer_class(self) -> None:
-        """Test that connect() falls back to printer's USB_PRODUCT_ID."""
-        with patch("usb.core.find") as mock_find:
-            mock_device = MagicMock()
-            mock_find.return_value = mock_device
-            mock_device.is_kernel_driver_active.return_value = False
+        usb_find.return_value = device
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-            mock_cfg = MagicMock()
-            mock_device.get_active_configuration.return_value = mock_cfg
+        assert conn._device is device
 
-            with patch("usb.util.find_descriptor") as mock_find_desc:
-                mock_ep = MagicMock()
-                mock_find_desc.return_value = mock_ep
+    def test_init_error_evicts_cached_device(self, usb_find: MagicMock) -> None:
+        """Test that a cached device failing to initialize is looked up again on retry."""
+        device = usb_find.return_value
+        conn = ConnectionUSB(product_id=0x2086)
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        conn.close()
+        device.set_configuration.side_effect = usb.core.USBError("gone", errno=errno.ENODEV)
+        with pytest.raises(PrinterConnectionError):
+            conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
+        conn.close()
 
-                conn = ConnectionUSB()  # No explicit product_id
-                conn.connect(MockPrinter())  # type: ignore[arg-type]
+        device.set_configuration.side_effect = None
+        conn.connect(MOCK_PRINTER)  # type: ignore[arg-type]
 
-                call_kwargs = mock_find.call_args[1]
-                # Should use MockPrinter's USB_PRODUCT_ID
-                assert call_kwargs["idProduct"] == 0x1234
+        assert usb_find.call_count == 2
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2024-2026 Nicolai Buchwitz <nb@tipi-net.de>
+#
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Tests for the ptouch package namespace."""
+
+import subprocess
+import sys
+
+import pytest
+
+import ptouch
+
+
+class TestLazyImports:
+    """Test that public names are imported from their submodules on first access."""
+
+    def test_import_does_not_load_pillow_or_pyusb(self) -> None:
+        """Test that importing ptouch leaves Pillow and pyusb unimported."""
+        code = "import sys, ptouch; print(sorted({'PIL', 'usb'} & sys.modules.keys()))"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("name", ptouch.__all__)
+    def test_public_name_resolves(self, name: str) -> None:
+        """Test that every name in __all__ can be accessed."""
+        assert getattr(ptouch, name) is not None
+
+    def test_type_checking_flag_is_private(self) -> None:
+        """Test that the type-checking guard is not part of the namespace."""
+        assert not hasattr(ptouch, "TYPE_CHECKING")
+        assert "_TYPE_CHECKING" not in dir(ptouch)
@@ -89,24 +89,6 @@ class TestLabel:
 class TestTextLabel:
     """Test TextLabel class."""
 
-    @pytest.fixture
-    def font_path(self) -> str:
-        """Return path to a system font for testing."""
-        # Common font paths on various systems
-        import os
-
-        font_paths = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/dejavu-sans-fonts/DejaVuSans.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-            "C:/Windows/Fonts/arial.ttf",
-        ]
-        for path in font_paths:
-            if os.path.exists(path):
-                return path
-        pytest.skip("No suitable font found for testing")
-
     def test_text_label_initialization_with_tape_class(self, font_path: str) -> None:
         """Test TextLabel initialization with tape class."""
         label = TextLabel("Hello", Tape36mm, font_path)
@@ -230,3 +212,23 @@ class TestTextLabel:
         assert label.auto_size is False
         label.prepare(height=100)
         assert isinstance(label.image, Image.Image)
+
+    def test_text_labels_share_loaded_font(
+        self, font_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that labels with the same font path and size load the font once."""
+        from ptouch import label as label_module
+
+        calls = []
+        truetype = ImageFont.truetype
+
+        def counting_truetype(path: str, size: int) -> ImageFont.FreeTypeFont:
+            calls.append((path, size))
+            return truetype(path, size)
+
+        label_module._load_truetype.cache_clear()
+        monkeypatch.setattr(ImageFont, "truetype", counting_truetype)
+        for text in ("Cable 1", "Cable 2", "Cable 3"):
+            TextLabel(text, Tape36mm, font_path).prepare(height=100)
+        assert calls == [(font_path, 80)]
+        label_module._load_truetype.cache_clear()
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: 2024-2026 Nicolai Buchwitz <nb@tipi-net.de>
+#
+# SPDX-License-Identifier: LGPL-2.1-or-later
+
+"""Tests for the ptouch command-line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image, ImageFont
+
+from ptouch import __main__ as cli
+from ptouch.label import Label, TextLabel
+from ptouch.tape import Tape12mm
+
+from .conftest import MockConnection
+
+
+class TestRenderTextLabels:
+    """Test render_text_labels helper."""
+
+    TEXTS = ["Cable 1", "Cable 2", "Cable 3", "Cable 4", "Cable 5"]
+
+    def test_renders_all_labels_in_order(self, font_path: str) -> None:
+        """Test that every label is rendered and order is preserved."""
+        labels = [TextLabel(text, Tape12mm, font_path) for text in self.TEXTS]
+        rendered = cli.render_text_labels(labels, height=70, resolution_dpi=180)
+        assert [label.text for label in rendered] == self.TEXTS
+        assert all(label.image.height == 70 for label in rendered)
+
+    def test_process_pool_matches_serial_rendering(
+        self, font_path: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that pooled rendering produces the same images as serial rendering."""
+        pooled = cli.render_text_labels(
+            [TextLabel(text, Tape12mm, font_path) for text in self.TEXTS],
+            height=70,
+            resolution_dpi=180,
+        )
+        monkeypatch.setattr(cli, "PARALLEL_RENDER_THRESHOLD", len(self.TEXTS) + 1)
+        serial = cli.render_text_labels(
+            [TextLabel(text, Tape12mm, font_path) for text in self.TEXTS],
+            height=70,
+            resolution_dpi=180,
+        )
+        for a, b in zip(pooled, serial, strict=True):
+            assert a.image.tobytes() == b.image.tobytes()
+
+    def test_font_object_renders_serially(self, font_path: str) -> None:
+        """Test that labels with a pre-loaded font are rendered in-process."""
+        font = ImageFont.truetype(font_path, size=24)
+        labels = [TextLabel(text, Tape12mm, font) for text in self.TEXTS]
+        rendered = cli.render_text_labels(labels, height=70, resolution_dpi=180)
+        # Rendered in place, so the original objects are returned
+        assert all(a is b for a, b in zip(rendered, labels, strict=True))
+
+
+class TestAlignArgument:
+    """Test --align validation in the CLI."""
+
+    def test_all_combinations_are_valid(self) -> None:
+        """Test that every horizontal/vertical pair has an entry."""
+        assert len(cli._ALIGN_COMBOS) == len(cli.ALIGN_HORIZONTAL) * len(cli.ALIGN_VERTICAL)
+        assert cli._ALIGN_COMBOS[("left", "bottom")] == ("LEFT", "BOTTOM")
+
+    @pytest.mark.parametrize("align", [["middle", "top"], ["left", "middle"]])
+    def test_invalid_alignment_is_rejected(
+        self,
+        align: list[str],
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that an invalid pair exits with a single error message."""
+        monkeypatch.setattr("ptouch.connection.ConnectionNetwork", lambda host: MockConnection())
+        monkeypatch.setattr(
+            "sys.argv",
+            ["ptouch", "Hello", "--host", "127.0.0.1", "-p", "E550W", "--tape-width", "12"]
+            + ["--align", *align],
+        )
+        assert cli.main() == 1
+        err = capsys.readouterr().err
+        assert "Invalid alignment" in err
+        assert cli._VALID_ALIGNS in err
+
+
+class TestImageArgument:
+    """Test --image handling in the CLI."""
+
+    @pytest.mark.parametrize("size", [(1200, 800), (300, 40)])
+    def test_image_keeps_its_size(
+        self, size: tuple[int, int], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that images are not scaled, so tall images are cropped by the printer."""
+        path = tmp_path / "label.jpg"
+        Image.new("RGB", size, "white").save(path)
+        printed: list[Label] = []
+        monkeypatch.setattr("ptouch.connection.ConnectionNetwork", lambda host: MockConnection())
+        monkeypatch.setattr(
+            "ptouch.printer.LabelPrinter.print", lambda self, label, **kwargs: printed.append(label)
+        )
+        monkeypatch.setattr(
+            "sys.argv",
+            ["ptouch", "-i", str(path), "--host", "127.0.0.1", "-p", "E550W", "-t", "12"],
+        )
+        assert cli.main() == 0
+        assert printed[0].image.size == size
+        assert printed[0].image.mode == "L"
+
+
+class TestFontArgument:
+    """Test --font handling in the CLI."""
+
+    @pytest.mark.parametrize("count", [1, cli.PARALLEL_RENDER_THRESHOLD])
+    def test_missing_font_reports_error(
+        self,
+        count: int,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test that a missing font is reported, whether rendered serially or in the pool."""
+        texts = [f"Label {i}" for i in range(count)]
+        font = str(tmp_path / "missing.ttf")
+        monkeypatch.setattr("ptouch.connection.ConnectionNetwork", lambda host: MockConnection())
+        monkeypatch.setattr(
+            "sys.argv",
+            ["ptouch", *texts, "--font", font, "--host", "127.0.0.1", "-p", "E550W", "-t", "12"],
+        )
+        assert cli.main() == 1
+        assert capsys.readouterr().err.startswith("Error: ")
+
+
+class TestStartup:
+    """Test the CLI start-up cost."""
+
+    def test_help_does_not_load_pillow_or_pyusb(self) -> None:
+        """Test that --help exits cleanly without importing Pillow or pyusb."""
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "ptouch", "--help"],
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0
+        assert "usage:" in result.stdout
+        # -X importtime logs one "self | cumulative | module" line per import
+        imported = {line.split("|")[-1].strip() for line in result.stderr.splitlines()}
+        assert not {name.split(".")[0] for name in imported} & {"PIL", "usb"}
+
+
+class TestParseArgsFast:
+    """Test the argument parsing fast path."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["Hello", "--printer", "E550W", "--tape-width", "12", "--host", "10.0.0.1"],
+            ["A", "B", "-p", "P900", "-t", "3.5", "-H", "printer.local"],
+            ["-p", "P750W", "Label 1", "Label 2", "-H", "10.0.0.1", "-t", "24"],
+        ],
+    )
+    def test_matches_argparse(self, argv: list[str], monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the fast path produces the same values as argparse."""
+        monkeypatch.setattr("sys.argv", ["ptouch", *argv])
+        fast = cli._parse_args_fast(argv)
+        assert fast is not None
+        assert vars(fast) == vars(cli.parse_args())
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--help"],
+            ["Hello", "-p", "E550W", "-t", "12"],
+            ["Hello", "-p", "E550W", "-t", "12", "--usb"],
+            ["Hello", "-p", "E550W", "-t", "12", "-H", "10.0.0.1", "--copies", "2"],
+            ["Hello", "-p", "E550W", "-t", "13", "-H", "10.0.0.1"],
+            ["Hello", "-p", "QL800", "-t", "12", "-H", "10.0.0.1"],
+            ["Hello", "-p", "E550W", "-t", "wide", "-H", "10.0.0.1"],
+            ["Hello", "-p", "E550W", "-t", "12", "--host=10.0.0.1"],
+            ["Hello", "-p", "E550W", "-t", "12", "-H"],
+            ["A", "-p", "E550W", "B", "-t", "12", "-H", "10.0.0.1"],
+        ],
+    )
+    def test_falls_back_to_argparse(self, argv: list[str]) -> None:
+        """Test that anything outside the common form is left to argparse."""
+        assert cli._parse_args_fast(argv) is None
+
+
+class TestDefaultFont:
+    """Test the cached default font loader."""
+
+    def test_default_font_is_loaded_once(self) -> None:
+        """Test that repeated calls reuse the same font object."""
+        cli._default_font.cache_clear()
+        assert cli._default_font() is cli._default_font()
+        assert cli._default_font.cache_info().misses == 1
+
+    def test_bitmap_default_font_is_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a non-scalable default font raises RuntimeError."""
+        cli._default_font.cache_clear()
+        monkeypatch.setattr(ImageFont, "load_default", lambda: ImageFont.ImageFont())
+        with pytest.raises(RuntimeError, match="not scalable"):
+            cli._default_font()
+        cli._default_font.cache_clear()
@@ -347,6 +347,72 @@ class TestImagePreparation:
         expected_length = img_1bit.width * printer.BYTES_PER_LINE
         assert len(raster) == expected_length
 
+    def test_generate_raster_full_width_tape(self, mock_connection: MockConnection) -> None:
+        """Test raster bits for a tape that uses every print head pin."""
+        printer = PTE550W(mock_connection)
+        config = printer.get_tape_config(Tape24mm())
+        assert config.is_full_width
+
+        img_1bit = Image.new("1", (3, config.print_pins), 1)
+        img_1bit.putpixel((0, 0), 0)  # first pin of the first column
+        img_1bit.putpixel((1, 9), 0)  # second bit of the second byte
+        img_1bit.putpixel((2, config.print_pins - 1), 0)  # last pin of the last column
+        raster = printer._generate_raster(img_1bit, config)
+
+        columns = [raster[i : i + 16] for i in range(0, len(raster), 16)]
+        assert columns[0] == b"\x80" + bytes(15)
+        assert columns[1] == b"\x00\x40" + bytes(14)
+        assert columns[2] == bytes(15) + b"\x01"
+
+    def test_generate_raster_places_print_area_between_margins(
+        self, mock_connection: MockConnection
+    ) -> None:
+        """Test that printable rows are shifted by left_pins and margins stay blank."""
+        printer = PTE550W(mock_connection)
+        config = printer.get_tape_config(Tape12mm())  # 29 left, 70 print, 29 right pins
+
+        img_1bit = Image.new("1", (2, config.print_pins), 0)  # all black
+        img_1bit.putpixel((1, 0), 1)  # first printable pin of column 2 is white
+        raster = printer._generate_raster(img_1bit, config)
+
+        first = int.from_bytes(raster[:16], "big")
+        second = int.from_bytes(raster[16:], "big")
+        print_area = ((1 << config.print_pins) - 1) << config.right_pins
+        assert first == print_area
+        assert second == print_area & ~(1 << (printer.TOTAL_PINS - 1 - config.left_pins))
+
+
+class TestBuildRasterData:
+    """Test raster line encoding."""
+
+    def test_compressed_lines(self, mock_connection: MockConnection) -> None:
+        """Test that empty lines use Z and other lines use PackBits-encoded G records."""
+        import packbits
+
+        printer = PTE550W(mock_connection, use_compression=True)
+        line = bytes(range(16))
+        raster = bytes(16) + line + line
+        data = printer._build_raster_data(raster, num_lines=3, high_resolution=False)
+        compressed = packbits.encode(line)
+        record = b"\x47" + len(compressed).to_bytes(2, "little") + compressed
+        assert data == b"\x5a" + record + record
+
+    def test_uncompressed_lines(self, mock_connection: MockConnection) -> None:
+        """Test that uncompressed lines are all sent as raw G records."""
+        printer = PTE550W(mock_connection, use_compression=False)
+        line = bytes(range(16))
+        raster = bytes(16) + line
+        data = printer._build_raster_data(raster, num_lines=2, high_resolution=False)
+        assert data == b"\x47\x10\x00" + bytes(16) + b"\x47\x10\x00" + line
+
+    def test_high_resolution_repeats_lines(self, mock_connection: MockConnection) -> None:
+        """Test that high resolution sends each line twice."""
+        printer = PTE550W(mock_connection, use_compression=True)
+        raster = bytes(16) + b"\xff" * 16
+        normal = printer._build_raster_data(raster, num_lines=2, high_resolution=False)
+        high = printer._build_raster_data(raster, num_lines=2, high_resolution=True)
+        assert high == b"\x5a\x5a" + normal[1:] * 2
+
 
 class TestLabelPrinterPrintMulti:
     """Test the print_multi workflow for multiple labels."""
@@ -457,3 +523,96 @@ class TestLabelPrinterPrintMulti:
         ]
         printer.print_multi(labels, high_resolution=True)
         assert len(mock_connection.data) > 0
+
+    def test_print_multi_encodes_repeated_label_once(
+        self,
+        mock_connection: MockConnection,
+        sample_image_with_content: Image.Image,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a label repeated for copies is only rasterized once."""
+        printer = PTE550W(mock_connection, use_compression=True)
+        calls = []
+        generate_raster = printer._generate_raster
+
+        def counting_generate_raster(img_1bit: Image.Image, tape_config: TapeConfig) -> bytes:
+            calls.append(img_1bit)
+            return generate_raster(img_1bit, tape_config)
+
+        monkeypatch.setattr(printer, "_generate_raster", counting_generate_raster)
+        label = Label(sample_image_with_content, Tape12mm)
+        printer.print_multi([label] * 3)
+        assert len(calls) == 1
+
+    def test_print_multi_repeated_label_matches_distinct_labels(
+        self, sample_image_with_content: Image.Image
+    ) -> None:
+        """Test that repeated labels produce the same output as distinct identical labels."""
+        repeated = MockConnection()
+        label = Label(sample_image_with_content, Tape12mm)
+        PTE550W(repeated).print_multi([label] * 3)
+
+        distinct = MockConnection()
+        labels = [Label(sample_image_with_content, Tape12mm) for _ in range(3)]
+        PTE550W(distinct).print_multi(labels)
+
+        assert repeated.data == distinct.data
+
+    def test_print_multi_sends_labels_in_one_write(
+        self,
+        mock_connection: MockConnection,
+        sample_image_with_content: Image.Image,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that small labels are coalesced into a single connection write."""
+        printer = PTE550W(mock_connection)
+        writes: list[bytes] = []
+        monkeypatch.setattr(mock_connection, "write", writes.append)
+        labels = [Label(sample_image_with_content, Tape12mm) for _ in range(3)]
+        printer.print_multi(labels)
+        assert len(writes) == 1
+        assert writes[0].count(b"\x0c") >= 2
+        assert writes[0].endswith(b"\x1a")
+
+    def test_print_multi_sends_job_as_one_burst(
+        self,
+        mock_connection: MockConnection,
+        sample_image_with_content: Image.Image,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the job is written between begin_burst and end_burst."""
+        printer = PTE550W(mock_connection)
+        calls: list[str] = []
+        monkeypatch.setattr(mock_connection, "begin_burst", lambda: calls.append("begin"))
+        monkeypatch.setattr(mock_connection, "write", lambda payload: calls.append("write"))
+        monkeypatch.setattr(mock_connection, "end_burst", lambda: calls.append("end"))
+        printer.print_multi([Label(sample_image_with_content, Tape12mm)] * 2)
+        assert calls == ["begin", "write", "end"]
+
+    def test_print_multi_encode_error_sends_nothing(
+        self,
+        mock_connection: MockConnection,
+        sample_image_with_content: Image.Image,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a label failing to encode aborts the job without a partial write."""
+        printer = PTE550W(mock_connection)
+        initialized = mock_connection.data
+        encode_label = printer._encode_label
+        encoded: list[Label] = []
+
+        def failing_encode_label(label: Label, high_resolution: bool) -> tuple[int, bytes]:
+            if encoded:
+                raise RuntimeError("render failed")
+            encoded.append(label)
+            return encode_label(label, high_resolution)
+
+        monkeypatch.setattr(printer, "_encode_label", failing_encode_label)
+        flushes: list[None] = []
+        monkeypatch.setattr(mock_connection, "flush", lambda: flushes.append(None))
+        labels = [Label(sample_image_with_content, Tape12mm) for _ in range(2)]
+        with pytest.raises(RuntimeError, match="render failed"):
+            printer.print_multi(labels)
+        assert flushes == []
+        assert mock_connection.data == initialized
+        assert mock_connection._write_buffer == []